@@ -205,6 +205,7 @@ with open('semicolon_data.csv', 'w') as f:
 
 
 # Read with custom delimiter
+# (csv_dialect.read_csv_auto detects delimiter and header automatically)
 df_semicolon = pd.read_csv('semicolon_data.csv', delimiter=';')
 print("\n--- CSV with semicolon delimiter ---")
 print(df_semicolon)
@@ -319,6 +320,7 @@ df_filled = df_missing.fillna({'age': 0, 'city': 'Unknown'})
 print(df_filled)
 
 # Option 3: Fill with mean/median for numerical columns
+# (csv_impute.impute_csv does the same for files that don't fit in memory)
 df_missing_copy = df_missing.copy()
 df_missing_copy['age'] = df_missing_copy['age'].fillna(df_missing_copy['age'].mean())
 print("\n--- Fill missing age with mean age ---")
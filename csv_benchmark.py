@@ -0,0 +1,430 @@
+"""
+READER-ENGINE BENCHMARK HARNESS
+
+csv_basic.py shows csv.reader, csv.DictReader and pd.read_csv next to each
+other, but never says which one is faster - or by how much, or at what
+memory cost. The csv_*.py modules each claim a speedup too.
+This harness measures all of them the same way:
+
+1. DATA: employees.csv-shaped files (name, age, city, salary, department,
+   plus optional extra numeric columns) of any size, generated in chunks
+
+2. SCENARIOS - the four ways the files are actually used:
+       full       load every row and column
+       subset     only age and salary (numeric, so every engine can do it)
+       filtered   engineers younger than 35
+       aggregate  mean salary per department
+
+3. ENGINES: csv module, pandas C parser, pandas pyarrow parser (if pyarrow
+   is installed) and the readers of this repo (records, pushdown,
+   parallel, streaming group-by, numeric). Not every engine does every
+   scenario - missing combinations are skipped. Before an engine is timed,
+   its result is checked against pd.read_csv: a fast wrong answer is not
+   reported.
+
+4. MEASUREMENTS per run:
+       wall time   time.perf_counter()
+       CPU time    time.process_time() + CPU of child processes
+       peak RSS    resource.getrusage() - the most memory the process used
+   Peak RSS only ever goes up within a process, so every run happens in a
+   FRESH Python subprocess (the interpreter + imports are measured too and
+   reported as baseline_rss_mb).
+
+5. RESULTS are appended to a JSON-lines file (one run per line, tagged
+   with a run id), so two runs - before and after a change - can be
+   compared with compare_runs().
+
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+try:
+    import resource
+except ImportError:     # Windows: no getrusage, peak RSS is not recorded
+    resource = None
+
+try:
+    import pyarrow  # noqa: F401 - only needed for pd.read_csv(engine='pyarrow')
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+SCENARIOS = ('full', 'subset', 'filtered', 'aggregate')
+SUBSET_COLUMNS = ['age', 'salary']
+DEFAULT_RESULTS_PATH = 'benchmark_results.jsonl'
+
+CITIES = ['New York', 'San Francisco', 'Chicago', 'Boston', 'Seattle', 'Austin']
+DEPARTMENTS = ['Engineering', 'Data Science', 'Marketing', 'Sales', 'Finance']
+
+
+# Part 1: Test data
+
+def generate_employees(path, rows, extra_columns=0, chunk_rows=500_000, seed=0):
+    """
+    Writes an employees.csv-shaped file of `rows` rows.
+
+    Parameters:
+    path : str or Path
+        Output CSV file
+    rows : int
+        Number of data rows
+    extra_columns : int
+        Additional numeric columns metric_0, metric_1, ... (wider files)
+    chunk_rows : int
+        Rows generated per step (memory stays bounded)
+    seed : int
+        Random seed, same seed -> same file
+    """
+    rng = np.random.default_rng(seed)
+    written = 0
+    while written < rows:
+        count = min(chunk_rows, rows - written)
+        chunk = pd.DataFrame({
+            'name': [f"Employee {i}" for i in range(written, written + count)],
+            'age': rng.integers(20, 65, count),
+            'city': rng.choice(CITIES, count),
+            'salary': rng.integers(40_000, 150_000, count),
+            'department': rng.choice(DEPARTMENTS, count),
+        })
+        for i in range(extra_columns):
+            chunk[f"metric_{i}"] = rng.normal(100, 15, count).round(3)
+        chunk.to_csv(path, mode='w' if written == 0 else 'a', header=written == 0, index=False)
+        written += count
+    return path
+
+
+# Part 2: Engines x scenarios
+
+def _csv_module(path, scenario):
+    with open(path, 'r', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        age, salary, department = (header.index(c) for c in ('age', 'salary', 'department'))
+        if scenario == 'full':
+            return list(reader)
+        if scenario == 'subset':
+            return [(row[age], row[salary]) for row in reader]
+        if scenario == 'filtered':
+            return [row for row in reader
+                    if row[department] == 'Engineering' and int(row[age]) < 35]
+        totals, counts = defaultdict(float), defaultdict(int)
+        for row in reader:
+            totals[row[department]] += float(row[salary])
+            counts[row[department]] += 1
+        return {key: totals[key] / counts[key] for key in totals}
+
+
+def _pandas(engine):
+    def run(path, scenario):
+        if scenario == 'full':
+            return pd.read_csv(path, engine=engine)
+        if scenario == 'subset':
+            return pd.read_csv(path, engine=engine, usecols=SUBSET_COLUMNS)
+        if scenario == 'filtered':
+            frame = pd.read_csv(path, engine=engine)
+            return frame[(frame['department'] == 'Engineering') & (frame['age'] < 35)]
+        frame = pd.read_csv(path, engine=engine, usecols=['department', 'salary'])
+        return frame.groupby('department')['salary'].mean()
+    return run
+
+
+def _records(path, scenario):
+    from csv_records import iter_column_batches, iter_records
+    if scenario == 'full':
+        return list(iter_records(path))
+    if scenario == 'subset':
+        return [(record.age, record.salary) for record in iter_records(path)]
+    if scenario == 'filtered':
+        return [record for record in iter_records(path)
+                if record.department == 'Engineering' and record.age < 35]
+    totals, counts = defaultdict(float), defaultdict(int)
+    for batch in iter_column_batches(path):
+        for department, salary in zip(batch['department'], batch['salary']):
+            totals[department] += salary
+            counts[department] += 1
+    return {key: totals[key] / counts[key] for key in totals}
+
+
+def _pushdown(path, scenario):
+    from csv_pushdown import iter_csv_pushdown, read_csv_pushdown
+    if scenario == 'full':
+        return read_csv_pushdown(path)
+    if scenario == 'subset':
+        return read_csv_pushdown(path, columns=SUBSET_COLUMNS)
+    if scenario == 'filtered':
+        return read_csv_pushdown(path, filters=[('department', '==', 'Engineering'),
+                                                ('age', '<', 35)])
+    sums = [chunk.groupby('department')['salary'].agg(['sum', 'count'])
+            for chunk in iter_csv_pushdown(path, columns=['department', 'salary'])]
+    total = pd.concat(sums).groupby(level=0).sum()
+    return total['sum'] / total['count']
+
+
+def _parallel(path, scenario):
+    from csv_parallel import read_csv_parallel
+    if scenario == 'full':
+        return read_csv_parallel(path)
+    if scenario == 'subset':
+        return read_csv_parallel(path, usecols=SUBSET_COLUMNS)
+    return None
+
+
+def _groupby(path, scenario):
+    from csv_groupby import streaming_groupby
+    return streaming_groupby(path, by='department', value='salary')
+
+
+def _numeric(path, scenario):
+    from csv_numeric import parse_numeric_csv
+    return parse_numeric_csv(path, usecols=SUBSET_COLUMNS)
+
+
+ENGINES = {
+    'csv': {scenario: _csv_module for scenario in SCENARIOS},
+    'pandas-c': {scenario: _pandas('c') for scenario in SCENARIOS},
+    'pandas-pyarrow': ({scenario: _pandas('pyarrow') for scenario in SCENARIOS}
+                       if PYARROW_AVAILABLE else {}),
+    'records': {scenario: _records for scenario in SCENARIOS},
+    'pushdown': {scenario: _pushdown for scenario in SCENARIOS},
+    'parallel': {'full': _parallel, 'subset': _parallel},
+    'groupby': {'aggregate': _groupby},
+    'numeric': {'subset': _numeric},
+}
+
+
+# Part 3: Checking results against pd.read_csv
+
+def _as_frame(result, columns):
+    if isinstance(result, tuple):           # parse_numeric_csv: (columns, errors)
+        result = result[0]
+    if isinstance(result, dict):
+        return pd.DataFrame(result)[columns]
+    if isinstance(result, pd.DataFrame):
+        return result.reset_index(drop=True)[columns]
+    return pd.DataFrame([tuple(row) for row in result], columns=columns)
+
+
+def _as_means(result):
+    if isinstance(result, pd.DataFrame):    # streaming_groupby: one row per group
+        result = result['mean']
+    return {str(key): float(value) for key, value in dict(result).items()}
+
+
+def check_result(result, expected, scenario):
+    """
+    Raises ValueError if an engine's result differs from pd.read_csv's.
+
+    Values are compared after converting both sides (text from the csv
+    module is parsed as numbers where pandas has a numeric column).
+    """
+    if scenario == 'aggregate':
+        got, want = _as_means(result), _as_means(expected)
+        if got.keys() != want.keys() or not np.allclose([got[k] for k in want],
+                                                        list(want.values())):
+            raise ValueError("aggregate: means per group differ from pd.read_csv")
+        return
+
+    want = expected.reset_index(drop=True)
+    got = _as_frame(result, list(want.columns))
+    if len(got) != len(want):
+        raise ValueError(f"{scenario}: {len(got)} rows, pd.read_csv has {len(want)}")
+    for column in want.columns:
+        if pd.api.types.is_numeric_dtype(want[column]):
+            same = np.allclose(pd.to_numeric(got[column]).to_numpy(dtype=np.float64),
+                               want[column].to_numpy(dtype=np.float64), equal_nan=True)
+        else:
+            same = (got[column].astype(str).to_numpy() == want[column].astype(str).to_numpy()).all()
+        if not same:
+            raise ValueError(f"{scenario}: column {column!r} differs from pd.read_csv")
+
+
+def verify_engines(path, engines=None, scenarios=SCENARIOS):
+    """
+    Runs every engine x scenario once and checks it against pandas' C parser.
+    """
+    engines = engines or [name for name, runs in ENGINES.items() if runs]
+    baseline = _pandas('c')
+    for scenario in scenarios:
+        expected = baseline(path, scenario)
+        for engine in engines:
+            if scenario not in ENGINES[engine]:
+                continue
+            try:
+                check_result(ENGINES[engine][scenario](path, scenario), expected, scenario)
+            except ValueError as e:
+                raise ValueError(f"Engine {engine!r} returned a wrong result: {e}") from None
+
+
+# Part 4: Measuring one run
+
+def _peak_rss_bytes(who):
+    if resource is None:
+        return None
+    peak = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def measure(engine, scenario, path):
+    """
+    Runs one engine/scenario in THIS process and returns its measurements.
+    """
+    run = ENGINES[engine][scenario]
+    baseline = _peak_rss_bytes(resource.RUSAGE_SELF) if resource else None
+    children_cpu = os.times().children_user + os.times().children_system
+
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    run(path, scenario)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    cpu += os.times().children_user + os.times().children_system - children_cpu
+
+    peak = _peak_rss_bytes(resource.RUSAGE_SELF) if resource else None
+    children_peak = _peak_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None
+    return {
+        'wall_s': round(wall, 4),
+        'cpu_s': round(cpu, 4),
+        'peak_rss_mb': round(peak / 1024**2, 1) if peak else None,
+        'children_peak_rss_mb': round(children_peak / 1024**2, 1) if children_peak else None,
+        'baseline_rss_mb': round(baseline / 1024**2, 1) if baseline else None,
+    }
+
+
+def measure_in_subprocess(engine, scenario, path):
+    """
+    Runs measure() in a fresh interpreter, so peak RSS belongs to this run only.
+    """
+    completed = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--measure', engine, scenario,
+         os.path.abspath(path)],
+        capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+# Part 5: Benchmark runs and comparisons
+
+def run_benchmarks(path, engines=None, scenarios=SCENARIOS, repeat=3,
+                   results_path=DEFAULT_RESULTS_PATH, run_id=None, isolate=True, verify=True):
+    """
+    Measures every engine x scenario `repeat` times and appends the results.
+
+    Parameters:
+    path : str or Path
+        CSV file to read (see generate_employees())
+    engines : list of str, optional
+        Names from ENGINES (default: all available)
+    scenarios : list of str
+        Names from SCENARIOS
+    repeat : int
+        Runs per combination (compare_runs() uses the median)
+    results_path : str or Path
+        JSON-lines file the results are appended to
+    run_id : str, optional
+        Label of this benchmark run (default: current date and time)
+    isolate : bool
+        Each run in a fresh subprocess (needed for a meaningful peak RSS)
+    verify : bool
+        First check every result against pd.read_csv (verify_engines())
+
+    Returns:
+    list of result dicts (one per run)
+    """
+    run_id = run_id or datetime.now().strftime('%Y%m%d-%H%M%S')
+    engines = engines or [name for name, runs in ENGINES.items() if runs]
+    if verify:
+        verify_engines(path, engines, scenarios)
+    with open(path, 'r', newline='') as f:
+        columns = len(next(csv.reader(f)))
+    file_info = {
+        'file': os.path.basename(str(path)),
+        'file_bytes': os.path.getsize(path),
+        'columns': columns,
+        'python': sys.version.split()[0],
+        'pandas': pd.__version__,
+    }
+
+    results = []
+    with open(results_path, 'a') as out:
+        for engine in engines:
+            for scenario in scenarios:
+                if scenario not in ENGINES[engine]:
+                    continue
+                for attempt in range(repeat):
+                    if isolate:
+                        measured = measure_in_subprocess(engine, scenario, path)
+                    else:
+                        measured = measure(engine, scenario, path)
+                    result = {'run_id': run_id, 'engine': engine, 'scenario': scenario,
+                              'attempt': attempt, **file_info, **measured}
+                    out.write(json.dumps(result) + '\n')
+                    results.append(result)
+                print(f"{engine:<15} {scenario:<10} wall {measured['wall_s']:8.3f}s  "
+                      f"cpu {measured['cpu_s']:8.3f}s  peak {measured['peak_rss_mb']} MB")
+    return results
+
+
+def load_results(results_path=DEFAULT_RESULTS_PATH):
+    with open(results_path, 'r') as f:
+        return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+
+
+def compare_runs(baseline_run, candidate_run, results_path=DEFAULT_RESULTS_PATH):
+    """
+    Median wall time / CPU time / peak RSS of two runs side by side.
+
+    Returns:
+    pd.DataFrame indexed by (engine, scenario); speedup > 1 means the
+    candidate is faster
+    """
+    results = load_results(results_path)
+    medians = {}
+    for label, run_id in (('baseline', baseline_run), ('candidate', candidate_run)):
+        run = results[results['run_id'] == run_id]
+        if run.empty:
+            raise ValueError(f"No results for run {run_id!r} in {results_path}")
+        medians[label] = run.groupby(['engine', 'scenario'])[
+            ['wall_s', 'cpu_s', 'peak_rss_mb']].agg(statistics.median)
+
+    table = medians['baseline'].join(medians['candidate'], lsuffix='_baseline',
+                                     rsuffix='_candidate', how='outer')
+    table['speedup'] = (table['wall_s_baseline'] / table['wall_s_candidate']).round(2)
+    return table
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark CSV reader engines")
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--extra-columns', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--results', default=DEFAULT_RESULTS_PATH)
+    parser.add_argument('--engines', nargs='*')
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CANDIDATE'))
+    parser.add_argument('--measure', nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        # Child process of measure_in_subprocess()
+        print(json.dumps(measure(*args.measure)))
+    elif args.compare:
+        print(compare_runs(*args.compare, results_path=args.results))
+    else:
+        print("=" * 70)
+        print("CSV READER BENCHMARK")
+        print("=" * 70)
+        generate_employees('employees_benchmark.csv', args.rows, args.extra_columns)
+        run_benchmarks('employees_benchmark.csv', engines=args.engines,
+                       repeat=args.repeat, results_path=args.results)
+        os.remove('employees_benchmark.csv')
@@ -0,0 +1,253 @@
+"""
+MEMORY-MAPPED NUMERIC COLUMN CACHE
+
+The outlier checks in day_24_data_quality.py (Part 8) are usually run many
+times with different thresholds. Each run re-parses the whole CSV just to get
+one numeric column back, and parsing text is by far the slowest step.
+
+The idea:
+- Parse the column ONCE and save it as a NumPy .npy file
+- Keep a small manifest (JSON) that says which source file it came from
+- Later runs open the .npy with np.load(mmap_mode='r')
+  -> no parsing, no copying, the OS pages data in only when it is touched
+
+Cache validity:
+A cached column is only correct while the source CSV is unchanged.
+We store a FINGERPRINT of the source (size, modification time and a hash of
+the first/last bytes). If the fingerprint changes, the column is re-parsed.
+
+Layout on disk (next to each other in the cache directory):
+    .column_cache/
+        manifest.json
+        <source-key>__<hash of column + read_csv options>.npy
+
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+# How many bytes from the start and end of the file go into the fingerprint
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+# Rows per chunk while parsing (keeps memory bounded for huge files)
+PARSE_CHUNK_ROWS = 1_000_000
+
+
+# Part 1: Fingerprinting the source file
+
+def file_fingerprint(path):
+    """
+    Builds a cheap fingerprint of a file without reading all of it.
+
+    Reading a 20 GB file just to hash it would defeat the purpose of a cache,
+    so we combine:
+    - file size and modification time (change on almost every edit)
+    - a hash of the first and last FINGERPRINT_SAMPLE_BYTES bytes
+      (catches edits that keep the same size and restore the mtime)
+
+    Parameters:
+    path : str or Path
+        File to fingerprint
+
+    Returns:
+    dict: {'size': int, 'mtime_ns': int, 'sample_hash': str}
+    """
+    path = Path(path)
+    stat = path.stat()
+
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE_BYTES))
+        if stat.st_size > FINGERPRINT_SAMPLE_BYTES:
+            f.seek(max(stat.st_size - FINGERPRINT_SAMPLE_BYTES, FINGERPRINT_SAMPLE_BYTES))
+            digest.update(f.read())
+
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sample_hash': digest.hexdigest(),
+    }
+
+
+def source_key(path):
+    """
+    Short, filesystem-safe name for a source file (based on its absolute path).
+    """
+    absolute = str(Path(path).resolve())
+    return hashlib.blake2b(absolute.encode('utf-8'), digest_size=8).hexdigest()
+
+
+# Part 2: The cache itself
+
+class NumericColumnCache:
+    """
+    Saves parsed numeric CSV columns as .npy files and re-opens them memory-mapped.
+
+    Example:
+        cache = NumericColumnCache('.column_cache')
+        amounts = cache.get_column('customers.csv', 'purchase_amount')
+        # first call: parses the CSV and writes the .npy
+        # later calls: np.load(..., mmap_mode='r') - no parsing at all
+
+    Missing values are stored as NaN (the column is always float64), which
+    matches what pandas does when a numeric column has gaps.
+    """
+
+    def __init__(self, cache_dir='.column_cache'):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.cache_dir / 'manifest.json'
+
+    # --- manifest helpers ---
+
+    def _load_manifest(self):
+        if not self.manifest_path.exists():
+            return {}
+        with open(self.manifest_path, 'r') as f:
+            return json.load(f)
+
+    def _save_manifest(self, manifest):
+        # Write to a temporary file first, then rename:
+        # a crash never leaves a half-written manifest behind
+        tmp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _entry_name(self, csv_path, column, read_csv_kwargs):
+        # The column name can contain '/' or other path characters, and options
+        # like sep=';' or decimal=',' change the parsed values: both are hashed
+        details = json.dumps([column, sorted(read_csv_kwargs.items())], default=str)
+        details_hash = hashlib.blake2b(details.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{source_key(csv_path)}__{details_hash}"
+
+    # --- public API ---
+
+    def get_column(self, csv_path, column, **read_csv_kwargs):
+        """
+        Returns the column as a read-only, memory-mapped float64 array.
+
+        Parameters:
+        csv_path : str or Path
+            Source CSV file
+        column : str
+            Name of the numeric column
+        **read_csv_kwargs :
+            Extra options for pd.read_csv (e.g. sep=';') used on a cache miss
+
+        Returns:
+        numpy.memmap (read-only)
+        """
+        entry_name = self._entry_name(csv_path, column, read_csv_kwargs)
+        npy_path = self.cache_dir / f"{entry_name}.npy"
+        fingerprint = file_fingerprint(csv_path)
+
+        manifest = self._load_manifest()
+        entry = manifest.get(entry_name)
+
+        if entry is None or entry['fingerprint'] != fingerprint or not npy_path.exists():
+            row_count = self._parse_to_npy(csv_path, column, npy_path, read_csv_kwargs)
+            manifest[entry_name] = {
+                'source': str(Path(csv_path).resolve()),
+                'column': column,
+                'rows': row_count,
+                'dtype': 'float64',
+                'fingerprint': fingerprint,
+            }
+            self._save_manifest(manifest)
+
+        return np.load(npy_path, mmap_mode='r')
+
+    def invalidate(self, csv_path=None):
+        """
+        Removes cached columns for one source file (or everything if csv_path is None).
+        """
+        manifest = self._load_manifest()
+        prefix = None if csv_path is None else source_key(csv_path) + '__'
+
+        for entry_name in list(manifest):
+            if prefix is None or entry_name.startswith(prefix):
+                npy_path = self.cache_dir / f"{entry_name}.npy"
+                if npy_path.exists():
+                    npy_path.unlink()
+                del manifest[entry_name]
+
+        self._save_manifest(manifest)
+
+    def _parse_to_npy(self, csv_path, column, npy_path, read_csv_kwargs):
+        """
+        Parses one column in chunks and writes it as an .npy file.
+
+        The row count is unknown until the end, so chunks are first appended
+        to a raw binary file. That file is then copied into a properly sized
+        .npy (via open_memmap), which keeps memory bounded by one chunk.
+        """
+        raw_path = npy_path.with_suffix('.raw.tmp')
+        row_count = 0
+
+        with open(raw_path, 'wb') as raw_file:
+            chunks = pd.read_csv(csv_path, usecols=[column], chunksize=PARSE_CHUNK_ROWS,
+                                 **read_csv_kwargs)
+            for chunk in chunks:
+                values = pd.to_numeric(chunk[column], errors='coerce').to_numpy(dtype=np.float64)
+                values.tofile(raw_file)
+                row_count += len(values)
+
+        tmp_npy_path = npy_path.with_suffix('.npy.tmp')
+        target = np.lib.format.open_memmap(tmp_npy_path, mode='w+', dtype=np.float64,
+                                           shape=(row_count,))
+        if row_count:
+            target[:] = np.memmap(raw_path, dtype=np.float64, mode='r', shape=(row_count,))
+        target.flush()
+        del target
+
+        os.replace(tmp_npy_path, npy_path)
+        raw_path.unlink()
+        return row_count
+
+
+# Part 3: Outlier stats on top of the cache
+
+def zscore_outliers(values, threshold=3.0):
+    """
+    Returns the row positions whose |z-score| is above the threshold.
+
+    Works directly on the memory-mapped array, NaN values are ignored
+    (same as dropna() in day_24_data_quality.py).
+    """
+    mean = np.nanmean(values)
+    std = np.nanstd(values, ddof=1)     # ddof=1 matches pandas' .std()
+    if not std:
+        return np.array([], dtype=np.int64)
+    z_scores = (values - mean) / std
+    return np.flatnonzero(np.abs(z_scores) > threshold)
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("MEMORY-MAPPED COLUMN CACHE DEMO")
+    print("=" * 70)
+
+    sample = pd.DataFrame({
+        'customer_id': range(1001, 1011),
+        'purchase_amount': [50.00, 75.50, 1000000.00, None, 120.00, 85.30,
+                            45.00, None, 95.00, 120.00],
+    })
+    sample.to_csv('customers.csv', index=False)
+
+    cache = NumericColumnCache('.column_cache')
+
+    # First call parses, the rest are served from the memory-mapped .npy
+    for threshold in [3.0, 2.0, 1.0]:
+        amounts = cache.get_column('customers.csv', 'purchase_amount')
+        outlier_rows = zscore_outliers(amounts, threshold)
+        print(f"threshold={threshold}: outlier rows {outlier_rows.tolist()}")
+
+    cache.invalidate('customers.csv')
+    os.remove('customers.csv')
@@ -0,0 +1,247 @@
+"""
+TRANSPARENT COLUMNAR CACHE: CSV -> PARQUET / FEATHER
+
+csv_basic.py calls pd.read_csv('employees.csv') three times. Dashboards do
+the same thing hundreds of times a day on much bigger files.
+
+Parsing CSV text is slow. Columnar binary formats are fast to read:
+- PARQUET: compressed, typed columns (small on disk, very fast to load)
+- FEATHER: uncompressed Arrow memory layout (even faster, bigger on disk)
+
+Both also support COLUMN PRUNING: reading ['name', 'salary'] only touches
+those two columns on disk.
+
+How the cache works:
+1. First read of a CSV -> parse it once, save it as Parquet/Feather
+2. Later reads -> load the columnar file instead (with only the columns asked for)
+3. The cache key is the CSV path + its fingerprint (see csv_column_cache.py),
+   so an edited CSV is automatically re-converted
+4. An index file remembers when each entry was last used; when the cache grows
+   above max_bytes the LEAST RECENTLY USED entries are deleted (LRU eviction)
+
+Parquet and Feather need pyarrow. Without it the loader simply falls back to
+pd.read_csv, so code using it keeps working (just without the speedup).
+
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from csv_column_cache import file_fingerprint, source_key
+
+try:
+    import pyarrow  # noqa: F401 - only needed by pandas' parquet/feather support
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    print("Note: pyarrow not installed. CSV files will be read without caching.")
+    print("Install with: pip install pyarrow")
+
+
+# Default size limit for the whole cache directory (1 GB)
+DEFAULT_MAX_CACHE_BYTES = 1024 ** 3
+
+FORMAT_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather'}
+
+
+class ColumnarCSVCache:
+    """
+    Drop-in loader that serves repeated pd.read_csv calls from a columnar cache.
+
+    Example:
+        cache = ColumnarCSVCache('.csv_cache', max_bytes=5 * 1024**3)
+        df = cache.read_csv('employees.csv')                        # parses + caches
+        df = cache.read_csv('employees.csv', columns=['name'])      # served from Parquet
+
+    Parameters:
+    cache_dir : str or Path
+        Where converted files and the index live
+    max_bytes : int
+        Size limit for all cached files together
+    file_format : str
+        'parquet' (smaller) or 'feather' (faster, bigger)
+    """
+
+    def __init__(self, cache_dir='.csv_cache', max_bytes=DEFAULT_MAX_CACHE_BYTES,
+                 file_format='parquet'):
+        if file_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"file_format must be one of {list(FORMAT_EXTENSIONS)}, "
+                             f"got {file_format!r}")
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / 'index.json'
+        self.max_bytes = max_bytes
+        self.file_format = file_format
+
+    # Part 1: Index bookkeeping
+
+    def _load_index(self):
+        if not self.index_path.exists():
+            return {}
+        with open(self.index_path, 'r') as f:
+            return json.load(f)
+
+    def _save_index(self, index):
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def _entry_name(self, csv_path, fingerprint, read_csv_kwargs):
+        # Options like sep=';' or dtype change the resulting frame,
+        # so they are part of the key too
+        details = json.dumps([fingerprint, sorted(read_csv_kwargs.items())], default=str)
+        details_hash = hashlib.blake2b(details.encode('utf-8'), digest_size=8).hexdigest()
+        return f"{source_key(csv_path)}-{details_hash}"
+
+    def _remove_entry(self, index, entry_name):
+        entry = index.pop(entry_name)
+        cached_file = self.cache_dir / entry['file']
+        if cached_file.exists():
+            cached_file.unlink()
+
+    # Part 2: Reading
+
+    def read_csv(self, csv_path, columns=None, **read_csv_kwargs):
+        """
+        Returns the CSV as a DataFrame, using the columnar cache when possible.
+
+        Parameters:
+        csv_path : str or Path
+            Source CSV file
+        columns : list of str, optional
+            Only load these columns (column pruning)
+        **read_csv_kwargs :
+            Options for pd.read_csv used on a cache miss (sep, dtype, ...)
+        """
+        if not PYARROW_AVAILABLE:
+            return pd.read_csv(csv_path, usecols=columns, **read_csv_kwargs)
+
+        fingerprint = file_fingerprint(csv_path)
+        entry_name = self._entry_name(csv_path, fingerprint, read_csv_kwargs)
+        index = self._load_index()
+
+        entry = index.get(entry_name)
+        if entry is None or not (self.cache_dir / entry['file']).exists():
+            df = self._convert(csv_path, entry_name, fingerprint, index, read_csv_kwargs)
+            if columns is not None:
+                df = df[list(columns)]
+        else:
+            df = self._read_cached(self.cache_dir / entry['file'], columns, entry)
+
+        index[entry_name]['last_used'] = time.time()
+        self._evict(index, keep=entry_name)
+        self._save_index(index)
+        return df
+
+    def _read_cached(self, cached_file, columns, entry):
+        if self.file_format == 'parquet':
+            # The index (e.g. from index_col=) is kept in the Parquet metadata
+            return pd.read_parquet(cached_file, columns=columns)
+
+        # Feather has no index: it was stored as ordinary columns
+        index_columns = entry.get('index_columns', [])
+        if columns is not None:
+            columns = index_columns + list(columns)
+        df = pd.read_feather(cached_file, columns=columns)
+        if index_columns:
+            df = df.set_index(index_columns)
+            df.index.names = entry['index_names']
+        return df
+
+    def _convert(self, csv_path, entry_name, fingerprint, index, read_csv_kwargs):
+        """
+        Parses the CSV once and writes the columnar copy (atomically).
+        """
+        # Entries made from an older version of this source are stale now -
+        # drop them (entries for other read_csv options stay)
+        prefix = source_key(csv_path) + '-'
+        for stale in [name for name in index
+                      if name.startswith(prefix) and index[name].get('fingerprint') != fingerprint]:
+            self._remove_entry(index, stale)
+
+        df = pd.read_csv(csv_path, **read_csv_kwargs)
+
+        file_name = entry_name + FORMAT_EXTENSIONS[self.file_format]
+        tmp_path = self.cache_dir / (file_name + '.tmp')
+        index_columns, index_names = [], []
+        if self.file_format == 'parquet':
+            df.to_parquet(tmp_path)
+        elif isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1:
+            df.reset_index(drop=True).to_feather(tmp_path)
+        else:
+            flat = df.reset_index()
+            index_columns = [str(name) for name in flat.columns[:df.index.nlevels]]
+            index_names = list(df.index.names)
+            flat.to_feather(tmp_path)
+        os.replace(tmp_path, self.cache_dir / file_name)
+
+        index[entry_name] = {
+            'source': str(Path(csv_path).resolve()),
+            'fingerprint': fingerprint,
+            'file': file_name,
+            'bytes': (self.cache_dir / file_name).stat().st_size,
+            'last_used': time.time(),
+            'index_columns': index_columns,
+            'index_names': index_names,
+        }
+        return df
+
+    # Part 3: LRU eviction
+
+    def _evict(self, index, keep=None):
+        """
+        Deletes least recently used entries until the cache fits in max_bytes.
+
+        The entry that was just used (`keep`) is never evicted, even if it is
+        bigger than the whole limit on its own.
+        """
+        total = sum(entry['bytes'] for entry in index.values())
+        by_age = sorted(index, key=lambda name: index[name]['last_used'])
+        for entry_name in by_age:
+            if total <= self.max_bytes:
+                break
+            if entry_name == keep:
+                continue
+            total -= index[entry_name]['bytes']
+            self._remove_entry(index, entry_name)
+
+    def cache_size(self):
+        """
+        Total bytes used by cached files.
+        """
+        return sum(entry['bytes'] for entry in self._load_index().values())
+
+    def clear(self):
+        index = self._load_index()
+        for entry_name in list(index):
+            self._remove_entry(index, entry_name)
+        self._save_index(index)
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("COLUMNAR CSV CACHE DEMO")
+    print("=" * 70)
+
+    with open('employees_cache_demo.csv', 'w') as f:
+        f.write('name,age,city,salary,department\n')
+        for i in range(300_000):
+            f.write(f"Employee {i},{20 + i % 40},Boston,{60000 + i % 50000},Engineering\n")
+
+    cache = ColumnarCSVCache('.csv_cache')
+
+    for attempt in range(1, 4):
+        start = time.perf_counter()
+        df = cache.read_csv('employees_cache_demo.csv', columns=['name', 'salary'])
+        print(f"Read {attempt}: {time.perf_counter() - start:.3f}s, shape {df.shape}")
+
+    print(f"Cache size: {cache.cache_size() / 1024**2:.2f} MB")
+
+    cache.clear()
+    os.remove('employees_cache_demo.csv')
@@ -0,0 +1,396 @@
+"""
+COMPRESSED CSV STREAMING (gzip / bz2 / xz)
+
+Vendor exports often arrive compressed: employees.csv.gz, employees.csv.xz.
+Decompressing the whole file to disk first costs time and disk space.
+Python's standard library can read them as streams instead:
+
+    gzip  (.gz)   - fast, moderate compression
+    bz2   (.bz2)  - slower, better compression
+    lzma  (.xz)   - slowest, best compression
+
+Two ways to make reading faster than a plain gzip.open():
+
+1. PIPELINING: decompress in a BACKGROUND THREAD while the main thread parses.
+   The codecs release the GIL while they work, so the two really overlap.
+   A bounded queue between them keeps memory small.
+
+2. PARALLEL BLOCKS: a gzip file may consist of many independent "members"
+   glued together. The BGZF layout (used by bioinformatics tools) writes
+   every member with its compressed size in the header, so we can find all
+   members WITHOUT decompressing and decompress several at once in a pool.
+   Files written by this module's writer use that layout.
+
+Entry point: open_text(path, mode) works like open() and picks the codec
+from the file extension (or the magic bytes for reading).
+
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+CODEC_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.lzma': 'xz'}
+MAGIC_BYTES = [(b'\x1f\x8b', 'gzip'), (b'BZh', 'bz2'), (b'\xfd7zXZ\x00', 'xz')]
+CODEC_OPENERS = {'gzip': gzip.open, 'bz2': bz2.open, 'xz': lzma.open}
+
+# Decompressed bytes per queue item, and how many items may wait in the queue
+READ_BLOCK_BYTES = 1024 * 1024
+QUEUE_BLOCKS = 8
+
+# BGZF: uncompressed bytes per block (the format allows at most 65280)
+BGZF_BLOCK_BYTES = 65280
+BGZF_EOF = bytes.fromhex('1f8b08040000000000ff0600424302001b0003000000000000000000')
+
+
+# Part 1: Detecting the codec
+
+def detect_codec(path):
+    """
+    Returns 'gzip', 'bz2', 'xz' or None (plain text).
+
+    The extension decides; for unknown extensions the first bytes are checked.
+    """
+    extension = os.path.splitext(str(path))[1].lower()
+    if extension in CODEC_EXTENSIONS:
+        return CODEC_EXTENSIONS[extension]
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            head = f.read(6)
+        for magic, codec in MAGIC_BYTES:
+            if head.startswith(magic):
+                return codec
+    return None
+
+
+# Part 2: Parallel BGZF decompression
+
+def _bgzf_block_size(header):
+    """
+    Total size of a BGZF member from its first bytes, or None if not BGZF.
+    """
+    if len(header) < 18 or header[:4] != b'\x1f\x8b\x08\x04':
+        return None
+    extra_length, = struct.unpack('<H', header[10:12])
+    extra = header[12:12 + extra_length]
+    position = 0
+    while position + 4 <= len(extra):
+        sub_id = extra[position:position + 2]
+        sub_length, = struct.unpack('<H', extra[position + 2:position + 4])
+        if sub_id == b'BC' and sub_length == 2:
+            block_size, = struct.unpack('<H', extra[position + 4:position + 6])
+            return block_size + 1
+        position += 4 + sub_length
+    return None
+
+
+def is_bgzf(path):
+    with open(path, 'rb') as f:
+        return _bgzf_block_size(f.read(64)) is not None
+
+
+def _iter_bgzf_blocks(raw):
+    while True:
+        header = raw.read(18)
+        if not header:
+            return
+        size = _bgzf_block_size(header)
+        if size is None:
+            raise ValueError("Not a BGZF block - the file mixes BGZF and plain gzip members")
+        yield header + raw.read(size - len(header))
+
+
+def _decompress_member(block):
+    # wbits=31: expect a gzip header and trailer around the deflate data
+    return zlib.decompress(block, wbits=31)
+
+
+def iter_bgzf_parallel(path, workers=None):
+    """
+    Yields the decompressed contents of a BGZF file, block by block, in order.
+
+    Up to `workers` blocks are decompressed at the same time; zlib releases
+    the GIL, so threads are enough.
+    """
+    workers = workers or os.cpu_count() or 1
+    with open(path, 'rb') as raw, ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for block in _iter_bgzf_blocks(raw):
+            pending.append(executor.submit(_decompress_member, block))
+            if len(pending) >= workers * 4:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# Part 3: Background-thread reader
+
+class _ThreadedReader(io.RawIOBase):
+    """
+    Binary stream whose data is produced by a background thread.
+
+    The producer puts decompressed blocks into a bounded queue; readinto()
+    takes them out. An exception in the producer is re-raised in the reader.
+    """
+
+    _DONE = object()
+
+    def __init__(self, produce_blocks):
+        self._queue = queue.Queue(maxsize=QUEUE_BLOCKS)
+        self._current = memoryview(b'')
+        self._finished = False
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(produce_blocks,), daemon=True)
+        self._thread.start()
+
+    def _run(self, produce_blocks):
+        try:
+            for block in produce_blocks():
+                if self._stop.is_set():
+                    return
+                self._put(block)
+            self._put(self._DONE)
+        except BaseException as e:     # handed over to the reading thread
+            self._put(e)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._current and not self._finished:
+            item = self._queue.get()
+            if item is self._DONE:
+                self._finished = True
+            elif isinstance(item, BaseException):
+                self._finished = True
+                raise item
+            else:
+                self._current = memoryview(item)
+        count = min(len(buffer), len(self._current))
+        buffer[:count] = self._current[:count]
+        self._current = self._current[count:]
+        return count
+
+    def close(self):
+        self._stop.set()
+        super().close()
+
+
+def open_binary(path, threaded=True, workers=None):
+    """
+    Opens a (possibly compressed) file for reading decompressed bytes.
+
+    threaded=True decompresses in a background thread (BGZF gzip files are
+    additionally decompressed in parallel).
+    """
+    codec = detect_codec(path)
+    if codec is None:
+        return open(path, 'rb')
+    if not threaded:
+        return CODEC_OPENERS[codec](path, 'rb')
+
+    if codec == 'gzip' and is_bgzf(path):
+        def produce_blocks():
+            return iter_bgzf_parallel(path, workers)
+    else:
+        def produce_blocks():
+            with CODEC_OPENERS[codec](path, 'rb') as f:
+                while True:
+                    block = f.read(READ_BLOCK_BYTES)
+                    if not block:
+                        return
+                    yield block
+
+    return io.BufferedReader(_ThreadedReader(produce_blocks), buffer_size=READ_BLOCK_BYTES)
+
+
+# Part 4: BGZF-style gzip writer
+
+class BlockGzipWriter(io.RawIOBase):
+    """
+    Writes gzip as independent BGZF members of at most 65280 input bytes.
+
+    Any gzip reader can read the result (it is ordinary multi-member gzip),
+    and iter_bgzf_parallel() can decompress it in parallel.
+    """
+
+    def __init__(self, path, mode='wb', compresslevel=6):
+        if mode not in ('wb', 'ab'):
+            raise ValueError(f"mode must be 'wb' or 'ab', got {mode!r}")
+        self._file = open(path, mode)
+        self._pending = bytearray()
+        self.compresslevel = compresslevel
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._pending += data
+        while len(self._pending) >= BGZF_BLOCK_BYTES:
+            self._write_block(bytes(self._pending[:BGZF_BLOCK_BYTES]))
+            del self._pending[:BGZF_BLOCK_BYTES]
+        return len(data)
+
+    def _write_block(self, data):
+        compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        block_size = 18 + len(deflated) + 8
+        header = (b'\x1f\x8b\x08\x04' + b'\x00\x00\x00\x00' + b'\x00\xff'
+                  + struct.pack('<H', 6) + b'BC' + struct.pack('<HH', 2, block_size - 1))
+        trailer = struct.pack('<II', zlib.crc32(data), len(data))
+        self._file.write(header + deflated + trailer)
+
+    def flush(self):
+        if self._file.closed:
+            return
+        if self._pending:
+            self._write_block(bytes(self._pending))
+            self._pending.clear()
+        self._file.flush()
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def close(self):
+        if self.closed:
+            return
+        self.flush()
+        self._file.write(BGZF_EOF)
+        self._file.close()
+        super().close()
+
+
+# Part 5: Text streams for the csv module
+
+def open_text(path, mode='r', encoding='utf-8', newline='', threaded=True, workers=None):
+    """
+    open() replacement that handles .gz / .bz2 / .xz transparently.
+
+    Parameters:
+    path : str or Path
+        File to open
+    mode : str
+        'r', 'w' or 'a' (text mode)
+    encoding, newline :
+        Same as for open(); newline='' is what the csv module wants
+    threaded : bool
+        Decompress in a background thread when reading
+    workers : int, optional
+        Threads for parallel BGZF decompression
+    """
+    if mode not in ('r', 'w', 'a'):
+        raise ValueError(f"mode must be 'r', 'w' or 'a', got {mode!r}")
+    codec = detect_codec(path) if mode == 'r' else CODEC_EXTENSIONS.get(
+        os.path.splitext(str(path))[1].lower())
+
+    if codec is None:
+        return open(path, mode, newline=newline, encoding=encoding)
+    if mode == 'r':
+        return io.TextIOWrapper(open_binary(path, threaded, workers), encoding=encoding,
+                                newline=newline)
+    if codec == 'gzip':
+        raw = BlockGzipWriter(path, mode + 'b')
+        return io.TextIOWrapper(io.BufferedWriter(raw, buffer_size=READ_BLOCK_BYTES),
+                                encoding=encoding, newline=newline)
+    # bz2 / xz: 'a' adds a new stream at the end, which readers handle fine
+    return CODEC_OPENERS[codec](path, mode + 't', encoding=encoding, newline=newline)
+
+
+def flush_text(stream):
+    """
+    Flushes a stream from open_text() all the way down to the OS.
+
+    io.BufferedWriter.flush() does not flush the raw stream under it, so
+    without this the last (partial) BGZF member of a .gz file would stay in
+    BlockGzipWriter until close(). bz2 / xz compressors can't be flushed
+    without ending their stream: there this covers what they have written.
+    """
+    stream.flush()
+    raw = getattr(getattr(stream, 'buffer', None), 'raw', None)
+    if raw is not None:
+        raw.flush()
+
+
+# Part 6: Benchmark by codec
+
+def benchmark_codecs(csv_path, workers=None):
+    """
+    Compresses a CSV with every codec and measures read throughput.
+
+    Reports compression ratio and MB/s of UNCOMPRESSED data for:
+    plain codec reader, threaded (pipelined) reader and - for gzip - the
+    parallel BGZF reader.
+    """
+    size = os.path.getsize(csv_path)
+    with open(csv_path, 'rb') as f:
+        data = f.read()
+
+    variants = {
+        'gzip': (csv_path + '.plain.gz', lambda p: gzip.open(p, 'wb')),
+        'gzip (BGZF)': (csv_path + '.gz', lambda p: BlockGzipWriter(p)),
+        'bz2': (csv_path + '.bz2', lambda p: bz2.open(p, 'wb')),
+        'xz': (csv_path + '.xz', lambda p: lzma.open(p, 'wb')),
+    }
+    results = {}
+    for label, (path, opener) in variants.items():
+        with opener(path) as f:
+            f.write(data)
+        ratio = size / os.path.getsize(path)
+
+        for threaded in (False, True):
+            start = time.perf_counter()
+            with open_binary(path, threaded=threaded, workers=workers) as f:
+                while f.read(READ_BLOCK_BYTES):
+                    pass
+            speed = size / 1024 ** 2 / (time.perf_counter() - start)
+            name = f"{label} {'threaded' if threaded else 'plain'}"
+            results[name] = {'ratio': ratio, 'mb_per_second': speed}
+            print(f"{name:<24} ratio {ratio:5.2f}x   {speed:8.1f} MB/s")
+        os.remove(path)
+    return results
+
+
+if __name__ == "__main__":
+    import csv
+
+    print("=" * 70)
+    print("COMPRESSED CSV STREAMING DEMO")
+    print("=" * 70)
+
+    with open_text('employees.csv.gz', 'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(['name', 'age', 'city', 'salary', 'department'])
+        for i in range(200_000):
+            writer.writerow([f"Employee {i}", 20 + i % 40, 'Boston', 60000 + i % 50000,
+                             'Engineering'])
+
+    print(f"Written as BGZF: {is_bgzf('employees.csv.gz')}")
+    with open_text('employees.csv.gz') as f:
+        rows = sum(1 for _ in csv.reader(f)) - 1
+    print(f"Rows read back: {rows}")
+
+    with open_text('employees.csv.gz') as compressed, open('employees_plain.csv', 'w') as plain:
+        plain.write(compressed.read())
+    print()
+    benchmark_codecs('employees_plain.csv')
+
+    os.remove('employees.csv.gz')
+    os.remove('employees_plain.csv')
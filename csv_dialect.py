@@ -0,0 +1,257 @@
+"""
+AUTOMATIC DIALECT DETECTION
+
+Section 6 of csv_basic.py has to KNOW the format of every file in advance:
+
+    pd.read_csv('semicolon_data.csv', delimiter=';')
+    pd.read_csv('no_header.csv', header=None, names=[...])
+
+When files come from many places that knowledge is usually missing.
+This module looks at a small sample from the start of the file and works out:
+
+    encoding        csv_encoding.sniff_encoding (BOM, UTF-8, UTF-16 without
+                    BOM, cp1252 / latin-1)
+    line ending     '\\r\\n', '\\n' or '\\r' (whichever is most common)
+    delimiter       csv.Sniffer, checked against a byte-frequency count:
+                    the right delimiter appears the SAME number of times
+                    on every line (outside quotes)
+    quote char      csv.Sniffer, '"' if the sample has no quoting
+    header          csv.Sniffer.has_header (the first row's types differ
+                    from the rest, e.g. 'age' above 25, 30, 35)
+
+Keeping it fast:
+- Only the first DIALECT_SAMPLE_BYTES are read, however large the file is
+- csv.Sniffer is regex based and slow on big inputs, so it only sees the
+  first SNIFF_LINES lines of the sample
+- Results are cached per source file (keyed by its fingerprint from
+  csv_column_cache.py): in memory for the current process, and optionally
+  in a JSON file so later runs skip detection completely
+
+"""
+
+import csv
+import json
+import os
+import re
+from collections import Counter
+from pathlib import Path
+
+import pandas as pd
+
+from csv_column_cache import file_fingerprint, source_key
+from csv_compression import open_binary
+from csv_encoding import sniff_encoding
+
+
+DIALECT_SAMPLE_BYTES = 64 * 1024
+SNIFF_LINES = 50
+CANDIDATE_DELIMITERS = ',;\t|'
+
+# Detected dialects of this process: source key -> (fingerprint, dialect)
+_DIALECT_CACHE = {}
+
+
+# Part 1: Reading the sample
+
+def read_sample(path, sample_bytes=DIALECT_SAMPLE_BYTES):
+    """
+    Returns up to sample_bytes from the start of a (possibly compressed) file.
+    """
+    with open_binary(path, threaded=False) as f:
+        return f.read(sample_bytes)
+
+
+def detect_line_ending(text):
+    crlf = text.count('\r\n')
+    lf = text.count('\n') - crlf
+    cr = text.count('\r') - crlf
+    counts = {'\r\n': crlf, '\n': lf, '\r': cr}
+    best = max(counts, key=counts.get)
+    return best if counts[best] else '\n'
+
+
+# Part 2: Delimiter by byte frequency
+
+def _strip_quoted(line, quotechar):
+    # Delimiters inside quoted fields don't count
+    quote = re.escape(quotechar)
+    return re.sub(f"{quote}[^{quote}]*{quote}", '', line)
+
+
+def delimiter_consistency(lines, delimiter, quotechar='"'):
+    """
+    Scores a candidate delimiter: (share of lines with the most common count, that count).
+
+    For the real delimiter almost every line has the same, non-zero count.
+    """
+    counts = Counter(_strip_quoted(line, quotechar).count(delimiter) for line in lines)
+    count, lines_with_count = counts.most_common(1)[0]
+    if count == 0:
+        return 0.0, 0
+    return lines_with_count / len(lines), count
+
+
+def guess_delimiter(lines, quotechar='"', candidates=CANDIDATE_DELIMITERS):
+    """
+    Picks the candidate with the most consistent (then largest) count per line.
+    """
+    scores = {d: delimiter_consistency(lines, d, quotechar) for d in candidates}
+    best = max(scores, key=scores.get)
+    return best if scores[best][1] else ','
+
+
+# Part 3: Putting it together
+
+def sniff_dialect(sample):
+    """
+    Detects the dialect of a byte sample (no caching, no file access).
+
+    Returns:
+    dict: encoding, lineterminator, delimiter, quotechar, has_header
+    """
+    encoding = sniff_encoding(sample)
+    text = sample.decode(encoding, errors='replace').lstrip('\ufeff')
+    lineterminator = detect_line_ending(text)
+
+    lines = text.split(lineterminator)
+    if len(lines) > 1:
+        lines = lines[:-1]      # the last line may be cut off by the sample size
+    lines = [line for line in lines[:SNIFF_LINES] if line.strip()] or ['']
+    head = '\n'.join(lines)
+
+    sniffer = csv.Sniffer()
+    try:
+        sniffed = sniffer.sniff(head, delimiters=CANDIDATE_DELIMITERS)
+        quotechar = sniffed.quotechar
+        delimiter = sniffed.delimiter
+        # Sniffer sometimes prefers a character that only appears in a few lines
+        heuristic = guess_delimiter(lines, quotechar)
+        if (delimiter_consistency(lines, heuristic, quotechar)
+                > delimiter_consistency(lines, delimiter, quotechar)):
+            delimiter = heuristic
+    except csv.Error:
+        quotechar = '"'
+        delimiter = guess_delimiter(lines, quotechar)
+
+    try:
+        has_header = sniffer.has_header(head)
+    except csv.Error:
+        has_header = True
+
+    return {
+        'encoding': encoding,
+        'lineterminator': lineterminator,
+        'delimiter': delimiter,
+        'quotechar': quotechar,
+        'has_header': has_header,
+    }
+
+
+def _load_cache_file(cache_file):
+    try:
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache_file(cache_file, entries):
+    tmp_path = Path(f"{cache_file}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(entries, f, indent=2)
+    os.replace(tmp_path, cache_file)
+
+
+def detect_dialect(path, sample_bytes=DIALECT_SAMPLE_BYTES, cache_file=None, use_cache=True):
+    """
+    Detects the dialect of a CSV file, re-using earlier results for unchanged files.
+
+    Parameters:
+    path : str or Path
+        CSV file (may be .gz / .bz2 / .xz compressed)
+    sample_bytes : int
+        Upper limit on the bytes read for detection
+    cache_file : str or Path, optional
+        JSON file that keeps results between runs
+    use_cache : bool
+        False forces a fresh detection
+
+    Returns:
+    dict: encoding, lineterminator, delimiter, quotechar, has_header
+    """
+    key = source_key(path)
+    fingerprint = file_fingerprint(path)
+
+    if use_cache:
+        cached = _DIALECT_CACHE.get(key)
+        if cached is not None and cached[0] == fingerprint:
+            return dict(cached[1])
+        if cache_file is not None:
+            entry = _load_cache_file(cache_file).get(key)
+            if entry is not None and entry['fingerprint'] == fingerprint:
+                _DIALECT_CACHE[key] = (fingerprint, entry['dialect'])
+                return dict(entry['dialect'])
+
+    dialect = sniff_dialect(read_sample(path, sample_bytes))
+    _DIALECT_CACHE[key] = (fingerprint, dialect)
+    if cache_file is not None:
+        entries = _load_cache_file(cache_file)
+        entries[key] = {'source': str(path), 'fingerprint': fingerprint, 'dialect': dialect}
+        _save_cache_file(cache_file, entries)
+    return dict(dialect)
+
+
+def read_csv_kwargs(dialect):
+    """
+    Translates a detected dialect into pd.read_csv keyword arguments.
+    """
+    kwargs = {
+        'sep': dialect['delimiter'],
+        'quotechar': dialect['quotechar'],
+        'header': 0 if dialect['has_header'] else None,
+        'encoding': dialect['encoding'],
+    }
+    # The C parser handles '\n' and '\r\n' by itself, only old Mac files need help
+    if dialect['lineterminator'] == '\r':
+        kwargs['lineterminator'] = '\r'
+    return kwargs
+
+
+def read_csv_auto(path, cache_file=None, **read_csv_kwargs_override):
+    """
+    pd.read_csv with the dialect detected automatically.
+
+    Anything passed explicitly (sep=, header=, names=, ...) wins over detection.
+    """
+    kwargs = read_csv_kwargs(detect_dialect(path, cache_file=cache_file))
+    kwargs.update(read_csv_kwargs_override)
+    return pd.read_csv(path, **kwargs)
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("DIALECT DETECTION DEMO")
+    print("=" * 70)
+
+    samples = {
+        'semicolon_data.csv': "name;age;country\nAlice;25;USA\nBob;30;UK\nCharlie;35;Canada\n",
+        'no_header.csv': "John,25,Engineer\nJane,30,Doctor\nJim,28,Teacher\n",
+        'tabs_crlf.csv': "name\tcity\tsalary\r\nJohn\t\"New York, NY\"\t75000\r\nAlice\tBoston\t95000\r\n",
+    }
+    for name, content in samples.items():
+        with open(name, 'w', newline='') as f:
+            f.write(content)
+
+        start = time.perf_counter()
+        dialect = detect_dialect(name)
+        first = time.perf_counter() - start
+        start = time.perf_counter()
+        detect_dialect(name)
+        cached = time.perf_counter() - start
+
+        print(f"\n{name}: {dialect}")
+        print(f"  detection {first * 1000:.2f} ms, cached {cached * 1000:.2f} ms")
+        print(read_csv_auto(name))
+        os.remove(name)
@@ -0,0 +1,242 @@
+"""
+KEY-BASED DIFF OF TWO CSV FILE VERSIONS
+
+"What changed between yesterday's and today's employees.csv?"
+
+The pandas way:
+    old = pd.read_csv('employees_old.csv')
+    new = pd.read_csv('employees_new.csv')
+    merged = old.merge(new, on='name', how='outer', indicator=True)
+needs both files AND the merged result in memory (~3x the data).
+
+Streaming diff:
+1. OLD FILE -> {key: hash of the other columns}
+   Only a 16-byte blake2b digest is kept per row, not the row itself.
+2. NEW FILE, row by row:
+      key not in map         -> insert
+      key in map, hash differs -> update
+      key in map, same hash  -> unchanged
+   Keys never seen in the new file are deletes.
+   Keys must be unique in each file; a repeated key raises ValueError.
+
+If the old file has more keys than fit in memory (max_keys), the diff
+switches to SORT-MERGE: both sides are sorted by key with sorted_stream()
+from csv_sort.py (spilled runs on disk) and walked side by side like a
+merge join - memory stays bounded by the run size.
+
+The result is a CHANGESET CSV: an 'op' column plus the row.
+    op,name,age,salary
+    update,John Smith,29,78000
+    insert,Zoe Lee,31,88000
+    delete,Bob Williams,,
+Deletes only carry the key columns (the old values aren't needed to apply them).
+
+"""
+
+import csv
+import hashlib
+import itertools
+from operator import itemgetter
+
+from csv_compression import open_text
+from csv_sort import DEFAULT_RUN_SIZE, sorted_stream
+from csv_writer import BufferedCSVWriter
+
+
+CHANGE_OPS = ('insert', 'update', 'delete')
+
+# Keys held in the in-memory map before switching to sort-merge
+DEFAULT_MAX_KEYS = 5_000_000
+
+
+def row_digest(values):
+    """
+    16-byte hash of a row's non-key values ('\\x1f' keeps 'ab','c' != 'a','bc').
+    """
+    return hashlib.blake2b('\x1f'.join(values).encode('utf-8'), digest_size=16).digest()
+
+
+def _keyed_rows(path, key_columns, encoding, fmtparams):
+    """
+    Yields (header, key_indexes) first, then (key, digest, row) for every row.
+    """
+    with open_text(path, 'r', encoding=encoding) as f:
+        reader = csv.reader(f, **fmtparams)
+        header = next(reader)
+        missing = [c for c in key_columns if c not in header]
+        if missing:
+            raise ValueError(f"Key columns {missing} are not in {path}")
+        key_indexes = [header.index(c) for c in key_columns]
+        value_indexes = [i for i in range(len(header)) if i not in key_indexes]
+        yield header, key_indexes
+
+        for row in reader:
+            if not row:
+                continue
+            row += [''] * (len(header) - len(row))
+            key = tuple(row[i] for i in key_indexes)
+            yield key, row_digest([row[i] for i in value_indexes]), row
+
+
+def _duplicate_key(key, path):
+    return ValueError(f"Key {key} appears more than once in {path}")
+
+
+# Part 1: Hash-map diff (old keys fit in memory)
+
+# Marks keys already seen in the new file (value in the old map)
+_SEEN = object()
+
+
+def _diff_in_memory(old_map, new_rows, new_path):
+    for key, digest, row in new_rows:
+        old_digest = old_map.get(key)
+        if old_digest is _SEEN:
+            raise _duplicate_key(key, new_path)
+        old_map[key] = _SEEN
+        if old_digest is None:
+            yield 'insert', key, row
+        elif old_digest != digest:
+            yield 'update', key, row
+    for key, digest in old_map.items():
+        if digest is not _SEEN:
+            yield 'delete', key, None
+
+
+# Part 2: Sort-merge diff (spilled runs)
+
+def _unique_keys(sorted_items, path):
+    # Repeated keys are next to each other once sorted
+    previous = None
+    for item in sorted_items:
+        if previous is not None and item[0] == previous:
+            raise _duplicate_key(item[0], path)
+        previous = item[0]
+        yield item
+
+
+def _diff_sorted(old_items, new_rows, run_size, tmp_dir, old_path, new_path):
+    old_sorted = _unique_keys(sorted_stream(old_items, key=itemgetter(0), run_size=run_size,
+                                            tmp_dir=tmp_dir), old_path)
+    new_sorted = _unique_keys(sorted_stream(new_rows, key=itemgetter(0), run_size=run_size,
+                                            tmp_dir=tmp_dir), new_path)
+    old_item = next(old_sorted, None)
+    new_item = next(new_sorted, None)
+    while old_item is not None or new_item is not None:
+        if new_item is None or (old_item is not None and old_item[0] < new_item[0]):
+            yield 'delete', old_item[0], None
+            old_item = next(old_sorted, None)
+        elif old_item is None or new_item[0] < old_item[0]:
+            yield 'insert', new_item[0], new_item[2]
+            new_item = next(new_sorted, None)
+        else:
+            if old_item[1] != new_item[1]:
+                yield 'update', new_item[0], new_item[2]
+            old_item = next(old_sorted, None)
+            new_item = next(new_sorted, None)
+
+
+# Part 3: The diff
+
+def iter_changes(old_path, new_path, key, max_keys=DEFAULT_MAX_KEYS, run_size=DEFAULT_RUN_SIZE,
+                 tmp_dir=None, encoding='utf-8', **fmtparams):
+    """
+    Yields the header once, then (op, key, row) for every change.
+
+    Keys must be unique within each file: a repeated key raises ValueError
+    (in both modes, so the changeset doesn't depend on max_keys).
+    In sort-merge mode changes come in key order, otherwise in file order.
+    """
+    key_columns = [key] if isinstance(key, str) else list(key)
+    old_rows = _keyed_rows(old_path, key_columns, encoding, fmtparams)
+    new_rows = _keyed_rows(new_path, key_columns, encoding, fmtparams)
+    old_header, _ = next(old_rows)
+    new_header, key_indexes = next(new_rows)
+    if old_header != new_header:
+        raise ValueError(f"Headers differ: {old_header} vs {new_header}")
+    yield new_header, key_indexes
+
+    old_map = {}
+    for row_key, digest, _ in old_rows:
+        if row_key in old_map:
+            raise _duplicate_key(row_key, old_path)
+        old_map[row_key] = digest
+        if len(old_map) > max_keys:
+            # Too many keys: continue with sorted runs on disk
+            old_items = itertools.chain(old_map.items(),
+                                        ((k, d) for k, d, _ in old_rows))
+            yield from _diff_sorted(old_items, new_rows, run_size, tmp_dir, old_path, new_path)
+            return
+    yield from _diff_in_memory(old_map, new_rows, new_path)
+
+
+def diff_csv(old_path, new_path, key, out_path, max_keys=DEFAULT_MAX_KEYS,
+             run_size=DEFAULT_RUN_SIZE, tmp_dir=None, encoding='utf-8', **fmtparams):
+    """
+    Writes the changes between two versions of a CSV file as a changeset CSV.
+
+    Parameters:
+    old_path, new_path : str or Path
+        The two versions (same header)
+    key : str or list of str
+        Column(s) identifying a row
+    out_path : str or Path
+        Changeset file: 'op' column + all columns of the file
+    max_keys : int
+        Old-file keys kept in memory before switching to sort-merge
+    run_size : int
+        Rows per sorted run in sort-merge mode
+    tmp_dir : str, optional
+        Folder for the spilled runs
+
+    Returns:
+    dict: number of rows per op
+    """
+    changes = iter_changes(old_path, new_path, key, max_keys, run_size, tmp_dir,
+                           encoding, **fmtparams)
+    header, key_indexes = next(changes)
+    counts = dict.fromkeys(CHANGE_OPS, 0)
+
+    with BufferedCSVWriter(out_path, fieldnames=['op'] + header, encoding=encoding) as writer:
+        batch = []
+        for op, row_key, row in changes:
+            counts[op] += 1
+            if row is None:
+                row = [''] * len(header)
+                for index, value in zip(key_indexes, row_key):
+                    row[index] = value
+            batch.append([op] + row)
+            if len(batch) >= writer.buffer_rows:
+                writer.write_rows(batch)
+                batch = []
+        writer.write_rows(batch)
+    return counts
+
+
+if __name__ == "__main__":
+    import os
+
+    print("=" * 70)
+    print("CSV DIFF DEMO")
+    print("=" * 70)
+
+    with open('employees_old.csv', 'w') as f:
+        f.write("name,age,city,salary\n"
+                "John Smith,28,New York,75000\n"
+                "Alice Johnson,34,San Francisco,95000\n"
+                "Bob Williams,45,Chicago,68000\n")
+    with open('employees_new.csv', 'w') as f:
+        f.write("name,age,city,salary\n"
+                "John Smith,29,New York,78000\n"
+                "Alice Johnson,34,San Francisco,95000\n"
+                "Zoe Lee,31,Boston,88000\n")
+
+    for max_keys in (DEFAULT_MAX_KEYS, 1):      # hash map, then forced sort-merge
+        counts = diff_csv('employees_old.csv', 'employees_new.csv', 'name', 'changes.csv',
+                          max_keys=max_keys, run_size=2)
+        print(f"\nmax_keys={max_keys}: {counts}")
+        with open('changes.csv') as f:
+            print(f.read())
+
+    for name in ('employees_old.csv', 'employees_new.csv', 'changes.csv'):
+        os.remove(name)
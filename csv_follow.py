@@ -0,0 +1,293 @@
+"""
+FOLLOWING A CSV FILE THAT KEEPS GROWING
+
+Section 9 of csv_basic.py appends rows to an existing file:
+
+    with open('products.csv', 'a') as f:
+        additional_products.to_csv(f, header=False, index=False)
+
+When another system does this all day long, re-reading the whole file to
+find the new rows gets slower with every append. A follower works like
+`tail -f`, but CSV-aware:
+
+1. BYTE OFFSET: remember where the last complete record ended, continue
+   reading from there. The offset is saved to a small JSON checkpoint file
+   (atomically: temp file + rename), so a restarted process continues where
+   the previous one stopped instead of starting over.
+
+2. ONLY COMPLETE RECORDS: the writer may be in the middle of a row (or in
+   the middle of a quoted field with a newline inside). A record is only
+   handed out once its record-ending newline is there - found with the
+   quote-aware scan_record_starts() from csv_row_index.py. How far the
+   scan got, and whether it stopped inside quotes, is remembered too, so a
+   long unfinished record isn't re-scanned on every poll.
+
+3. ROTATION AND TRUNCATION:
+   - rotation  : the file was renamed away and a new one created
+                 (different inode) -> finish the old file, start the new one at 0
+   - truncation: the file got shorter than what was already read
+                 -> start again at 0
+
+4. POLLING: os.stat() is cheap. Nothing is opened or read while size and
+   inode are unchanged, and the wait between polls grows while the file
+   is idle (up to max_interval).
+
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from pathlib import Path
+
+from csv_row_index import scan_record_starts
+
+
+CHECKPOINT_SUFFIX = '.follow.json'
+
+# Upper limit on new bytes handled per poll (keeps memory bounded on catch-up)
+MAX_POLL_BYTES = 16 * 1024 * 1024
+
+
+class CSVFollower:
+    """
+    Yields new, complete records of a CSV file as they are appended.
+
+    Example:
+        follower = CSVFollower('products.csv')
+        for record in follower.follow(poll_interval=0.5):
+            handle(record)          # ['Keyboard', '75', '50']
+        # follower.header -> ['product', 'price', 'stock']
+
+    Parameters:
+    path : str or Path
+        CSV file to follow
+    checkpoint_path : str or Path, optional
+        JSON checkpoint (default: <path>.follow.json); False disables checkpointing
+    has_header : bool
+        If True, the first record of each file is the header (not yielded)
+    encoding : str
+        Text encoding of the file
+    **fmtparams :
+        Passed to csv.reader
+    """
+
+    def __init__(self, path, checkpoint_path=None, has_header=True, encoding='utf-8', **fmtparams):
+        self.path = Path(path)
+        if checkpoint_path is None:
+            checkpoint_path = self.path.with_name(self.path.name + CHECKPOINT_SUFFIX)
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.has_header = has_header
+        self.encoding = encoding
+        self.fmtparams = fmtparams
+        self._quote = fmtparams.get('quotechar', '"').encode(encoding)
+
+        self.rotations = 0
+        self.truncations = 0
+        self._file = None
+        self._reset(identity=None)
+        self._load_checkpoint()
+
+    # Part 1: Checkpoint
+
+    def _reset(self, identity):
+        self.offset = 0             # end of the last complete record handed out
+        self.scanned = 0            # how far the quote-aware scan got
+        self.in_quotes = False      # quote state at `scanned`
+        self.header = None
+        self.identity = identity    # (st_dev, st_ino) of the file being read
+
+    def _load_checkpoint(self):
+        if self.checkpoint_path is None or not self.checkpoint_path.exists():
+            return
+        with open(self.checkpoint_path, 'r') as f:
+            state = json.load(f)
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return
+        # The file was replaced while we were not running -> start over
+        if (state['identity'] is None or (stat.st_dev, stat.st_ino) != tuple(state['identity'])
+                or stat.st_size < state['offset']):
+            return
+        self.identity = tuple(state['identity'])
+        self.offset = self.scanned = state['offset']
+        self.in_quotes = False
+        self.header = state['header']
+        if state.get('scanned', 0) >= self.offset and state['scanned'] <= stat.st_size:
+            self.scanned = state['scanned']
+            self.in_quotes = state['in_quotes']
+
+    def save_checkpoint(self):
+        """
+        Writes the current position atomically (temp file + rename).
+        """
+        if self.checkpoint_path is None:
+            return
+        state = {
+            'path': str(self.path),
+            'identity': list(self.identity) if self.identity else None,
+            'offset': self.offset,
+            'scanned': self.scanned,
+            'in_quotes': self.in_quotes,
+            'header': self.header,
+        }
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f, indent=2)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    # Part 2: Reading complete records
+
+    def _open(self):
+        try:
+            self._file = open(self.path, 'rb')
+        except FileNotFoundError:
+            self._file = None
+            return
+        stat = os.fstat(self._file.fileno())
+        identity = (stat.st_dev, stat.st_ino)
+        if self.identity is not None and identity != self.identity:
+            self._reset(identity)
+        self.identity = identity
+
+    def _read_complete(self):
+        """
+        Parses the complete records between self.offset and the end of the file.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        if size < self.scanned:
+            self.truncations += 1
+            self._reset(self.identity)
+        if size == self.scanned:
+            return []
+
+        # Read what was already scanned plus up to MAX_POLL_BYTES of new data
+        self._file.seek(self.offset)
+        buffer = self._file.read(min(size, self.scanned + MAX_POLL_BYTES) - self.offset)
+
+        starts, position, self.in_quotes = scan_record_starts(
+            buffer, self.scanned - self.offset, self.in_quotes, self._quote)
+        self.scanned = self.offset + position
+        if not starts:
+            return []
+
+        end = starts[-1]
+        text = buffer[:end].decode(self.encoding)
+        rows = [row for row in csv.reader(io.StringIO(text, newline=''), **self.fmtparams) if row]
+        self.offset += end
+
+        if self.has_header and self.header is None and rows:
+            self.header = rows.pop(0)
+        return rows
+
+    def poll(self):
+        """
+        Returns the complete records appended since the last call (may be []).
+
+        The checkpoint is not written here; call save_checkpoint() once the
+        records are processed (follow() does this after every batch).
+        """
+        if self._file is None:
+            self._open()
+            if self._file is None:
+                return []
+
+        records = self._read_complete()
+
+        # Rotation: finish the old file, then continue with the new one
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return records
+        if (stat.st_dev, stat.st_ino) != self.identity:
+            records += self._read_complete()
+            self._file.close()
+            self.rotations += 1
+            self._reset((stat.st_dev, stat.st_ino))
+            self._open()
+            if self._file is not None:
+                records += self._read_complete()
+        return records
+
+    def _has_news(self):
+        # Cheap check before reading anything
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return (self._file is None or (stat.st_dev, stat.st_ino) != self.identity
+                or stat.st_size != self.scanned)
+
+    # Part 3: Poll loop
+
+    def follow(self, poll_interval=0.5, max_interval=5.0, idle_timeout=None):
+        """
+        Generator: yields records forever (or until idle_timeout seconds without news).
+
+        The checkpoint is saved after each batch has been consumed, so a
+        crash never skips records (at worst the last batch is seen again).
+        """
+        interval = poll_interval
+        idle_since = time.monotonic()
+        while True:
+            records = self.poll() if self._has_news() else []
+            if records:
+                yield from records
+                self.save_checkpoint()
+                interval = poll_interval
+                idle_since = time.monotonic()
+                continue
+            if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                self.save_checkpoint()
+                return
+            time.sleep(interval)
+            interval = min(interval * 2, max_interval)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+if __name__ == "__main__":
+    import threading
+
+    print("=" * 70)
+    print("CSV FOLLOWER DEMO")
+    print("=" * 70)
+
+    with open('products_live.csv', 'w') as f:
+        f.write('product,price,stock\nLaptop,1200,15\n')
+
+    def upstream():
+        # Appends in pieces, including a record split in the middle of a quoted newline
+        pieces = ['Mouse,25,80\n', 'Keyboard,75,', '50\n', '"Monitor\n', '27 inch",300,20\n']
+        for piece in pieces:
+            time.sleep(0.2)
+            with open('products_live.csv', 'a') as f:
+                f.write(piece)
+
+    writer_thread = threading.Thread(target=upstream)
+    writer_thread.start()
+    with CSVFollower('products_live.csv') as follower:
+        for record in follower.follow(poll_interval=0.05, idle_timeout=1.0):
+            print(f"new record: {record}")
+        print(f"header: {follower.header}, offset: {follower.offset}")
+    writer_thread.join()
+
+    # A restart continues from the checkpoint: nothing is repeated
+    with open('products_live.csv', 'a') as f:
+        f.write('Webcam,90,12\n')
+    with CSVFollower('products_live.csv') as follower:
+        print(f"after restart: {follower.poll()}")
+
+    os.remove('products_live.csv')
+    os.remove('products_live.csv' + CHECKPOINT_SUFFIX)
@@ -0,0 +1,292 @@
+"""
+STREAMING GROUP-BY WITH MERGEABLE AGGREGATORS
+
+csv_basic.py computes:
+    df.groupby('department')['salary'].mean()
+    df['department'].value_counts()
+
+after loading the WHOLE file. The result only has one row per department,
+but the memory used follows the number of ROWS in the file.
+
+The trick: MERGEABLE STATE
+For each group we keep a small summary that can be
+1. updated with a new chunk of values, and
+2. MERGED with another summary of the same group.
+
+    count, sum, min, max  -> merge by adding / comparing
+    mean, variance        -> keep (count, mean, M2) and combine them with
+                             Chan's parallel formula (no second pass needed)
+    median                -> exact medians need all values, so we keep an
+                             approximate QUANTILE SKETCH instead: a histogram
+                             with logarithmic buckets, accurate to 1% by default
+
+Because summaries merge, the file can be cut into byte ranges
+(csv_parallel.split_ranges) and every range aggregated in its own process.
+The final answer is just all partial summaries merged together.
+
+Memory: O(number of groups), not O(number of rows).
+
+"""
+
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from csv_parallel import open_range, read_header, split_ranges
+
+
+# Rows parsed at once inside each worker
+DEFAULT_CHUNK_ROWS = 500_000
+
+
+# Part 1: Approximate quantiles
+
+class QuantileSketch:
+    """
+    Mergeable approximate quantiles with a relative error guarantee.
+
+    Values are counted in logarithmic buckets: bucket k holds values in
+    (gamma**(k-1), gamma**k]. Any quantile is then returned with at most
+    `relative_accuracy` relative error (0.01 -> within 1%).
+
+    Memory grows with the RANGE of values (a few hundred buckets for
+    salaries from 1 to 10 million), never with the number of values.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive = Counter()   # bucket index -> count
+        self.negative = Counter()   # buckets of -value for negative values
+        self.zero_count = 0
+        self.count = 0
+
+    def add_many(self, values):
+        """
+        Adds an array of values (NaN is ignored).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        self.count += len(values)
+        self.zero_count += int(np.count_nonzero(values == 0))
+
+        for store, part in ((self.positive, values[values > 0]),
+                            (self.negative, -values[values < 0])):
+            if len(part):
+                buckets = np.ceil(np.log(part) / self._log_gamma).astype(np.int64)
+                keys, counts = np.unique(buckets, return_counts=True)
+                store.update(dict(zip(keys.tolist(), counts.tolist())))
+
+    def add(self, value):
+        self.add_many([value])
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Can only merge sketches with the same relative_accuracy")
+        self.positive.update(other.positive)
+        self.negative.update(other.negative)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        return self
+
+    def _bucket_value(self, key):
+        # Midpoint (in relative terms) of the bucket -> error <= relative_accuracy
+        return 2 * self.gamma ** key / (self.gamma + 1)
+
+    def quantile(self, q):
+        """
+        Approximate q-quantile (q=0.5 is the median); NaN if no values.
+        """
+        if self.count == 0:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = 0
+
+        # Walk buckets from the smallest value to the largest
+        for key in sorted(self.negative, reverse=True):
+            seen += self.negative[key]
+            if seen > rank:
+                return -self._bucket_value(key)
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self.positive):
+            seen += self.positive[key]
+            if seen > rank:
+                return self._bucket_value(key)
+        return self._bucket_value(max(self.positive))
+
+
+# Part 2: Per-group state
+
+class GroupState:
+    """
+    Mergeable summary of the values of one group.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.count = 0
+        self.total = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self.mean = 0.0
+        self.m2 = 0.0       # sum of squared differences from the mean
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def add_many(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if not len(values):
+            return self
+
+        chunk = GroupState(self.sketch.relative_accuracy)
+        chunk.count = len(values)
+        chunk.total = float(values.sum())
+        chunk.minimum = float(values.min())
+        chunk.maximum = float(values.max())
+        chunk.mean = chunk.total / chunk.count
+        chunk.m2 = float(((values - chunk.mean) ** 2).sum())
+        chunk.sketch.add_many(values)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """
+        Combines two summaries (Chan et al. formula for mean and variance).
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.mean, self.m2 = other.mean, other.m2
+        else:
+            count = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / count
+            self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def result(self):
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.minimum if self.count else math.nan,
+            'max': self.maximum if self.count else math.nan,
+            'mean': self.mean if self.count else math.nan,
+            # ddof=1, same as pandas' .var()
+            'var': self.m2 / (self.count - 1) if self.count > 1 else math.nan,
+            'median_approx': self.sketch.quantile(0.5),
+        }
+
+
+def merge_group_states(target, source):
+    """
+    Merges {group: GroupState} dict `source` into `target` (in place).
+    """
+    for group, state in source.items():
+        if group in target:
+            target[group].merge(state)
+        else:
+            target[group] = state
+    return target
+
+
+# Part 3: Aggregating byte ranges in parallel
+
+def _aggregate_range(path, start, end, names, by, value, chunksize, relative_accuracy,
+                     read_csv_kwargs):
+    """
+    Worker: streams one byte range in chunks and returns {group: GroupState}.
+    """
+    states = {}
+    with open_range(path, start, end) as f:
+        chunks = pd.read_csv(f, header=None, names=names, usecols=[by, value],
+                             chunksize=chunksize, **read_csv_kwargs)
+        for chunk in chunks:
+            chunk_states = {}
+            for group, values in chunk.groupby(by)[value]:
+                chunk_states[group] = GroupState(relative_accuracy).add_many(values.to_numpy())
+            merge_group_states(states, chunk_states)
+    return states
+
+
+def streaming_groupby(path, by, value, workers=None, parts=None, chunksize=DEFAULT_CHUNK_ROWS,
+                      relative_accuracy=0.01, **read_csv_kwargs):
+    """
+    Group-by aggregation over a CSV file without loading it.
+
+    Parameters:
+    path : str or Path
+        CSV file with a header row
+    by : str
+        Column to group on (e.g. 'department')
+    value : str
+        Numeric column to aggregate (e.g. 'salary')
+    workers : int, optional
+        Number of processes (default: os.cpu_count())
+    parts : int, optional
+        Number of byte ranges (default: 4 per worker)
+    chunksize : int
+        Rows parsed at once inside each worker
+    relative_accuracy : float
+        Accuracy of the approximate median
+    **read_csv_kwargs :
+        Passed to pd.read_csv (sep, quotechar, ...)
+
+    Returns:
+    DataFrame indexed by group with columns
+    count, sum, min, max, mean, var, median_approx
+    """
+    workers = workers or os.cpu_count() or 1
+    parts = parts or workers * 4
+    quotechar = read_csv_kwargs.get('quotechar', '"')
+
+    header_end, ranges = split_ranges(path, parts, quotechar=quotechar, workers=workers)
+    names = read_header(path, header_end, read_csv_kwargs)
+
+    states = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_aggregate_range, path, start, end, names, by, value,
+                                   chunksize, relative_accuracy, read_csv_kwargs)
+                   for start, end in ranges]
+        # Final merge: every partial result folds into one dict
+        for future in futures:
+            merge_group_states(states, future.result())
+
+    result = pd.DataFrame.from_dict({group: state.result() for group, state in states.items()},
+                                    orient='index')
+    result.index.name = by
+    return result.sort_index()
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("STREAMING GROUP-BY DEMO")
+    print("=" * 70)
+
+    departments = ['Engineering', 'Data Science', 'Marketing']
+    with open('employees_groupby.csv', 'w') as f:
+        f.write('name,age,city,salary,department\n')
+        for i in range(300_000):
+            f.write(f"Employee {i},{20 + i % 40},Boston,{60000 + (i * 7919) % 50000},"
+                    f"{departments[i % 3]}\n")
+
+    summary = streaming_groupby('employees_groupby.csv', by='department', value='salary')
+    print("\nStreaming result:")
+    print(summary)
+
+    df = pd.read_csv('employees_groupby.csv')
+    print("\npandas (in-memory) for comparison:")
+    print(df.groupby('department')['salary'].agg(['count', 'mean', 'var', 'median']))
+
+    os.remove('employees_groupby.csv')
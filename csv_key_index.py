@@ -0,0 +1,292 @@
+"""
+SORTED KEY INDEX: BINARY-SEARCH LOOKUPS BY COLUMN VALUE
+
+csv_row_index.py answers "give me row N". Often we need something else:
+    "give me the row where name == 'Emma Davis'"
+    "give me all rows with salary between 80000 and 90000"
+
+Without an index that means reading all 100 million rows. Databases solve
+this with a SECONDARY INDEX, and we can build a simple one ourselves:
+
+1. For every row, take (key value, byte offset of the row)
+2. Sort those pairs by key - with an EXTERNAL sort (csv_sort.sorted_stream)
+   so it works even if the pairs don't fit in memory
+3. Save them as fixed-width binary records:  [key bytes][8-byte offset]
+4. To look up a key: memory-map the file and BINARY SEARCH it
+   -> about 27 comparisons for 100 million rows, instead of 100 million
+
+Keys are stored as bytes that sort in the same order as the values:
+- str   : UTF-8 bytes, zero-padded to the longest key
+- int   : 8 bytes, big-endian with the sign bit flipped
+- float : 8 bytes, IEEE bits transformed so negative numbers sort first
+
+The index remembers the fingerprint of the CSV (csv_column_cache.py).
+Opening it after the CSV changed rebuilds it automatically.
+
+Files for employees.csv indexed on 'name':
+    employees.csv.name.keyidx        sorted fixed-width records
+    employees.csv.name.keyidx.json   column, key type, width, fingerprint
+
+"""
+
+import bisect
+import json
+import mmap
+import os
+import struct
+
+from csv_column_cache import file_fingerprint
+from csv_row_index import RowIndex, read_record
+from csv_sort import sorted_stream
+
+
+OFFSET_STRUCT = struct.Struct('>Q')
+
+# Rows parsed per batch while building, and (key, offset) pairs per sorted run
+BUILD_BATCH_ROWS = 100_000
+SORT_RUN_SIZE = 2_000_000
+
+
+# Part 1: Order-preserving key encodings
+
+def _encode_int(value):
+    return struct.pack('>Q', int(value) + 2 ** 63)
+
+
+def _encode_float(value):
+    # + 0.0 turns -0.0 into 0.0: equal keys must have equal bytes
+    bits, = struct.unpack('>Q', struct.pack('>d', float(value) + 0.0))
+    # Negative floats: flip every bit (bigger magnitude -> smaller)
+    # Positive floats: flip only the sign bit (so they sort after negatives)
+    bits = bits ^ 0xFFFFFFFFFFFFFFFF if bits >> 63 else bits | 1 << 63
+    return struct.pack('>Q', bits)
+
+
+def _encode_str(value):
+    return str(value).encode('utf-8')
+
+
+KEY_ENCODERS = {'str': _encode_str, 'int': _encode_int, 'float': _encode_float}
+
+
+# Part 2: Building the index
+
+class _FixedWidthKeys:
+    """
+    Read-only sequence over the keys of the index file, for bisect.
+    """
+
+    def __init__(self, buffer, width, count):
+        self._buffer = buffer
+        self._width = width
+        self._record = width + OFFSET_STRUCT.size
+        self._count = count
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        start = i * self._record
+        return self._buffer[start:start + self._width]
+
+
+class KeyIndex:
+    """
+    Secondary index on one CSV column, stored as a sorted memory-mapped file.
+
+    Example:
+        by_name = KeyIndex('employees.csv', 'name')
+        print(by_name.lookup('Emma Davis'))
+
+        by_salary = KeyIndex('employees.csv', 'salary', key_type='int')
+        for row in by_salary.range_scan(80000, 90000):
+            print(row)
+
+    Parameters:
+    csv_path : str or Path
+        CSV file with a header row
+    column : str
+        Column to index
+    key_type : str
+        'str', 'int' or 'float' - decides the sort order
+    encoding : str
+        Text encoding of the CSV file
+    **fmtparams :
+        Passed to csv.reader (delimiter, quotechar, ...)
+
+    Rows with an empty value in the column are not indexed.
+    """
+
+    def __init__(self, csv_path, column, key_type='str', encoding='utf-8', **fmtparams):
+        if key_type not in KEY_ENCODERS:
+            raise ValueError(f"key_type must be one of {list(KEY_ENCODERS)}, got {key_type!r}")
+        self.csv_path = str(csv_path)
+        self.column = column
+        self.key_type = key_type
+        self.encoding = encoding
+        self.fmtparams = fmtparams
+        self.index_path = f"{self.csv_path}.{column}.keyidx"
+        self.meta_path = self.index_path + '.json'
+        self._encode = KEY_ENCODERS[key_type]
+        self._map = None
+        self.open()
+
+    def _load_meta(self):
+        if not (os.path.exists(self.meta_path) and os.path.exists(self.index_path)):
+            return None
+        with open(self.meta_path, 'r') as f:
+            return json.load(f)
+
+    def open(self):
+        """
+        Opens the index, (re)building it if the CSV changed since it was built.
+        """
+        self.close()
+        fingerprint = file_fingerprint(self.csv_path)
+        meta = self._load_meta()
+        if (meta is None or meta['fingerprint'] != fingerprint
+                or meta['column'] != self.column or meta['key_type'] != self.key_type):
+            meta = self.build(fingerprint)
+
+        self.width = meta['width']
+        self.count = meta['count']
+        self._record_size = self.width + OFFSET_STRUCT.size
+        if self.count:
+            with open(self.index_path, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._keys = _FixedWidthKeys(self._map, self.width, self.count)
+        else:
+            self._keys = []
+
+    def build(self, fingerprint=None):
+        """
+        Scans the CSV, externally sorts (key, offset) pairs and writes the index.
+        """
+        fingerprint = fingerprint or file_fingerprint(self.csv_path)
+        width = 0
+
+        with RowIndex(self.csv_path, encoding=self.encoding, **self.fmtparams) as rows:
+            column_index = rows.header.index(self.column)
+
+            def pairs():
+                nonlocal width
+                for start in range(0, len(rows), BUILD_BATCH_ROWS):
+                    batch = rows.rows(start, start + BUILD_BATCH_ROWS)
+                    for n, row in enumerate(batch, start):
+                        if column_index < len(row) and row[column_index] != '':
+                            key = self._encode(row[column_index])
+                            width = max(width, len(key))
+                            yield key, rows.record_offset(n)
+
+            count = 0
+            tmp_path = self.index_path + '.tmp'
+            with open(tmp_path, 'wb') as out:
+                # Ties on the key are ordered by offset, i.e. by file position
+                for key, offset in sorted_stream(pairs(), run_size=SORT_RUN_SIZE):
+                    # `width` is final here: sorting consumed every pair first
+                    out.write(key.ljust(width, b'\x00'))
+                    out.write(OFFSET_STRUCT.pack(offset))
+                    count += 1
+            os.replace(tmp_path, self.index_path)
+
+        meta = {
+            'column': self.column,
+            'key_type': self.key_type,
+            'width': width,
+            'count': count,
+            'fingerprint': fingerprint,
+        }
+        with open(self.meta_path, 'w') as f:
+            json.dump(meta, f, indent=2)
+        return meta
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    # Part 3: Lookups
+
+    def _offset_at(self, i):
+        start = i * self._record_size + self.width
+        return OFFSET_STRUCT.unpack(self._map[start:start + OFFSET_STRUCT.size])[0]
+
+    def _bound(self, value, side):
+        """
+        Binary search position for `value` ('left' or 'right' side).
+        """
+        key = self._encode(value)
+        if len(key) > self.width:
+            # Longer than every stored key: compare on the first `width` bytes.
+            # Stored keys equal to that prefix are smaller than `value`.
+            return bisect.bisect_right(self._keys, key[:self.width])
+        key = key.ljust(self.width, b'\x00')
+        search = bisect.bisect_left if side == 'left' else bisect.bisect_right
+        return search(self._keys, key)
+
+    def _fetch(self, first, stop):
+        with open(self.csv_path, 'rb') as f:
+            for i in range(first, stop):
+                yield read_record(f, self._offset_at(i), self.encoding, **self.fmtparams)
+
+    def lookup_offsets(self, value):
+        """
+        Byte offsets of all rows whose column equals `value`.
+        """
+        first, stop = self._bound(value, 'left'), self._bound(value, 'right')
+        return [self._offset_at(i) for i in range(first, stop)]
+
+    def lookup(self, value):
+        """
+        All rows (lists of strings) whose column equals `value`.
+        """
+        first, stop = self._bound(value, 'left'), self._bound(value, 'right')
+        return list(self._fetch(first, stop))
+
+    def range_scan(self, low=None, high=None):
+        """
+        Yields rows with low <= value <= high, in key order.
+
+        low=None / high=None leave that side open.
+        """
+        first = 0 if low is None else self._bound(low, 'left')
+        stop = self.count if high is None else self._bound(high, 'right')
+        yield from self._fetch(first, stop)
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("SORTED KEY INDEX DEMO")
+    print("=" * 70)
+
+    sample_csv_content = """name,age,city,salary,department
+John Smith,28,New York,75000,Engineering
+Alice Johnson,34,San Francisco,95000,Data Science
+Bob Williams,45,Chicago,68000,Marketing
+Emma Davis,29,Boston,82000,Engineering
+Michael Brown,38,Seattle,91000,Data Science
+Sarah Wilson,31,Austin,77000,Marketing
+David Lee,42,Denver,88000,Engineering
+"""
+
+    with open('employees_keyed.csv', 'w') as f:
+        f.write(sample_csv_content)
+
+    with KeyIndex('employees_keyed.csv', 'name') as by_name:
+        print(f"\nname == 'Emma Davis': {by_name.lookup('Emma Davis')}")
+
+    with KeyIndex('employees_keyed.csv', 'salary', key_type='int') as by_salary:
+        print("\n80000 <= salary <= 90000:")
+        for row in by_salary.range_scan(80000, 90000):
+            print(f"  {row}")
+
+    for path in ['employees_keyed.csv', 'employees_keyed.csv.rowidx',
+                 'employees_keyed.csv.name.keyidx', 'employees_keyed.csv.name.keyidx.json',
+                 'employees_keyed.csv.salary.keyidx', 'employees_keyed.csv.salary.keyidx.json']:
+        os.remove(path)
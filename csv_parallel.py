@@ -0,0 +1,293 @@
+"""
+PARALLEL CSV PARSING WITH QUOTE-AWARE BYTE RANGES
+
+Both csv.reader and pd.read_csv parse a file on ONE CPU core.
+On a 32-core machine that leaves 31 cores idle while we wait.
+
+The obvious idea - "cut the file into N pieces and parse them at the same
+time" - has one trap: a piece must start at the beginning of a RECORD.
+
+Why is that hard?
+A newline does not always end a record. Inside quotes it is just data:
+
+    name,comment
+    Alice,"first line
+    second line"
+    Bob,ok
+
+If we cut right after "first line\n", the next worker would start parsing
+in the middle of a quoted field and produce garbage.
+
+How we find safe cut points:
+1. Pick N rough split points (file_size / N apart)
+2. In parallel, count the quote characters in each piece
+   -> a running total tells us if a split point is INSIDE quotes
+      (odd number of quotes before it) or OUTSIDE (even number)
+   -> escaped quotes ("") count twice, so they never flip the answer
+3. From each rough split point, walk forward to the first newline that is
+   outside quotes. The byte after it is a safe record start.
+
+Then every range is parsed by pd.read_csv in a separate process and the
+resulting DataFrames are returned in file order.
+
+"""
+
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+# Size of the pieces used when counting quotes (keeps memory per worker small)
+SCAN_BLOCK_BYTES = 16 * 1024 * 1024
+
+
+# Part 1: Low-level scanning helpers
+
+def count_quotes(path, start, end, quotechar=b'"'):
+    """
+    Counts quote characters in bytes [start, end) of a file.
+
+    Runs in a worker process; reads through mmap in SCAN_BLOCK_BYTES pieces.
+    """
+    total = 0
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for block_start in range(start, end, SCAN_BLOCK_BYTES):
+                block_end = min(block_start + SCAN_BLOCK_BYTES, end)
+                total += mm[block_start:block_end].count(quotechar)
+    return total
+
+
+def next_record_start(buffer, position, in_quotes, quotechar=b'"'):
+    """
+    Returns the offset of the first record that starts at or after `position`.
+
+    Parameters:
+    buffer : mmap or bytes
+        The whole file
+    position : int
+        Where to start looking
+    in_quotes : bool
+        Whether `position` is inside a quoted field
+
+    Returns:
+    int: offset right after the first newline that is outside quotes
+         (len(buffer) if there is none)
+    """
+    size = len(buffer)
+    while position < size:
+        newline = buffer.find(b'\n', position)
+        if newline == -1:
+            return size
+        quote = buffer.find(quotechar, position, newline)
+        if quote == -1:
+            if not in_quotes:
+                return newline + 1
+            # Newline is part of a quoted value - keep walking
+            position = newline + 1
+        else:
+            in_quotes = not in_quotes
+            position = quote + 1
+    return size
+
+
+def split_ranges(path, parts, quotechar='"', workers=None):
+    """
+    Splits a CSV file into byte ranges that each start at a record boundary.
+
+    The first record is treated as the header and is NOT part of any range.
+
+    Parameters:
+    path : str or Path
+        CSV file
+    parts : int
+        How many ranges to aim for (fewer are returned for tiny files)
+    quotechar : str
+        Quote character of the file's dialect
+    workers : int, optional
+        Processes used to count quotes (default: os.cpu_count())
+
+    Returns:
+    (header_end, ranges) where ranges is a list of (start, end) tuples
+    """
+    quote = quotechar.encode('ascii')
+    size = os.path.getsize(path)
+    if size == 0:
+        return 0, []
+
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            header_end = next_record_start(mm, 0, False, quote)
+
+            # Step 1: rough, evenly spaced split points after the header
+            body = size - header_end
+            parts = max(1, min(parts, body))
+            rough = [header_end + body * i // parts for i in range(parts)] + [size]
+
+            # Step 2: quote counts per piece (in parallel) -> parity at each split
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                counts = list(executor.map(count_quotes,
+                                           [path] * parts, rough[:-1], rough[1:],
+                                           [quote] * parts))
+
+            # Step 3: walk from each rough split to the next real record start
+            boundaries = [header_end]
+            quotes_before = 0
+            for i in range(1, parts):
+                quotes_before += counts[i - 1]
+                in_quotes = quotes_before % 2 == 1
+                boundary = next_record_start(mm, rough[i], in_quotes, quote)
+                # A record that is longer than a whole piece can swallow a split
+                boundaries.append(max(boundary, boundaries[-1]))
+            boundaries.append(size)
+
+    ranges = [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+    return header_end, ranges
+
+
+# Part 2: Parsing ranges in worker processes
+
+class _RangeFile(io.RawIOBase):
+    """
+    Read-only file object that only exposes bytes [start, end) of a file.
+
+    pd.read_csv can read from it directly (also with chunksize), so a worker
+    never has to load its whole range into memory.
+    """
+
+    def __init__(self, path, start, end):
+        self._file = open(path, 'rb')
+        self._file.seek(start)
+        self._remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:self._remaining]
+        read = self._file.readinto(view)
+        self._remaining -= read
+        return read
+
+    def close(self):
+        self._file.close()
+        super().close()
+
+
+def open_range(path, start, end):
+    """
+    Opens bytes [start, end) of a file as a buffered binary file object.
+    """
+    return io.BufferedReader(_RangeFile(path, start, end))
+
+
+# Options that decide which LINES are data - they can't be applied per byte range
+UNSUPPORTED_OPTIONS = ('header', 'names', 'skiprows', 'nrows', 'skipfooter',
+                       'chunksize', 'iterator')
+
+# Options that select columns: applied by the workers, not to the header
+COLUMN_OPTIONS = ('usecols', 'index_col')
+
+
+def parse_range(path, start, end, names, read_csv_kwargs):
+    """
+    Parses one byte range into a DataFrame (the header was already consumed).
+
+    `names` is the FULL header; usecols / index_col in read_csv_kwargs
+    select from it exactly like they do for pd.read_csv.
+    """
+    with open_range(path, start, end) as f:
+        return pd.read_csv(f, header=None, names=names, **read_csv_kwargs)
+
+
+def read_header(path, header_end, read_csv_kwargs):
+    """
+    All column names from the header record (bytes [0, header_end)).
+    """
+    header_kwargs = {k: v for k, v in read_csv_kwargs.items() if k not in COLUMN_OPTIONS}
+    with open_range(path, 0, header_end) as f:
+        return list(pd.read_csv(f, nrows=0, **header_kwargs).columns)
+
+
+def iter_csv_parallel(path, workers=None, parts=None, **read_csv_kwargs):
+    """
+    Parses a CSV file in parallel and yields DataFrame chunks IN FILE ORDER.
+
+    Parameters:
+    path : str or Path
+        CSV file with a header row
+    workers : int, optional
+        Number of processes (default: os.cpu_count())
+    parts : int, optional
+        Number of byte ranges (default: 4 per worker, for load balancing)
+    **read_csv_kwargs :
+        Passed to every pd.read_csv call (sep, dtype, usecols, index_col, ...).
+        Options that pick rows by line number (header, names, skiprows,
+        nrows, ...) raise ValueError.
+    """
+    unsupported = sorted(set(read_csv_kwargs) & set(UNSUPPORTED_OPTIONS))
+    if unsupported:
+        raise ValueError(f"read_csv options {unsupported} are not supported by the parallel reader")
+    workers = workers or os.cpu_count() or 1
+    parts = parts or workers * 4
+    quotechar = read_csv_kwargs.get('quotechar', '"')
+
+    header_end, ranges = split_ranges(path, parts, quotechar=quotechar, workers=workers)
+    names = read_header(path, header_end, read_csv_kwargs) if header_end else None
+    if not ranges:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(parse_range, path, start, end, names, read_csv_kwargs)
+                   for start, end in ranges]
+        # Waiting on futures in submission order keeps the chunks ordered
+        for future in futures:
+            yield future.result()
+
+
+def read_csv_parallel(path, workers=None, parts=None, concat=True, **read_csv_kwargs):
+    """
+    Parallel replacement for pd.read_csv(path, **read_csv_kwargs).
+
+    Returns one DataFrame (concat=True) or the ordered list of chunks.
+    """
+    chunks = list(iter_csv_parallel(path, workers=workers, parts=parts, **read_csv_kwargs))
+    if not concat:
+        return chunks
+    if not chunks:
+        return pd.read_csv(path, **read_csv_kwargs)
+    # Without index_col every chunk has its own RangeIndex starting at 0
+    # ('is', not 'in': index_col=0 == False)
+    index_col = read_csv_kwargs.get('index_col')
+    return pd.concat(chunks, ignore_index=index_col is None or index_col is False)
+
+
+if __name__ == "__main__":
+    import time
+
+    print("=" * 70)
+    print("PARALLEL CSV PARSING DEMO")
+    print("=" * 70)
+
+    # Build an employees.csv-style file with some quoted newlines in it
+    with open('employees_parallel.csv', 'w', newline='') as f:
+        f.write('name,age,city,salary,department,notes\n')
+        for i in range(500_000):
+            notes = '"line one\nline two, with comma"' if i % 1000 == 0 else 'none'
+            f.write(f"Employee {i},{20 + i % 40},Boston,{60000 + i % 50000},Engineering,{notes}\n")
+
+    start = time.perf_counter()
+    single = pd.read_csv('employees_parallel.csv')
+    print(f"pd.read_csv (1 core):    {time.perf_counter() - start:.2f}s")
+
+    start = time.perf_counter()
+    parallel = read_csv_parallel('employees_parallel.csv')
+    print(f"read_csv_parallel ({os.cpu_count()} cores): {time.perf_counter() - start:.2f}s")
+
+    print(f"Same result: {single.equals(parallel)}")
+    os.remove('employees_parallel.csv')
@@ -0,0 +1,335 @@
+"""
+HIVE-STYLE PARTITIONED OUTPUT
+
+csv_basic.py writes everything into ONE file. Later, a question about one
+department ("average salary in Engineering") still has to scan every row.
+
+Partitioning splits the data by the value of a column while writing:
+
+    employees/
+        department=Engineering/part-0000.csv
+        department=Data%20Science/part-0000.csv
+        department=Marketing/part-0000.csv
+
+This folder naming (column=value) is called "Hive style" and is understood
+by pandas/pyarrow, Spark, DuckDB and others.
+
+Two halves:
+1. WRITER: streams rows into the right folder. Each folder has an open file,
+   but only `max_open_files` files stay open at once - the least recently
+   used one is closed when a new one is needed (and re-opened for appending
+   later). Many departments don't mean thousands of open file handles.
+2. READER: looks at the FOLDER NAMES first and skips every folder that can't
+   match the filter ("partition pruning"). Only matching files are opened.
+
+The partition column is stored in the folder name only, not inside the
+files. The reader adds it back as a (text) column.
+
+"""
+
+import csv
+import numbers
+import os
+from collections import OrderedDict
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+
+from csv_pushdown import FILTER_OPERATORS, filter_mask
+
+
+# Folder name used for missing partition values (same as Hive / Spark)
+NULL_PARTITION = '__HIVE_DEFAULT_PARTITION__'
+
+DEFAULT_MAX_OPEN_FILES = 64
+
+
+def _partition_value(value):
+    if value is None or value == '' or (isinstance(value, float) and value != value):
+        return NULL_PARTITION
+    # Escape '/', '=' and friends so every value is one safe folder name
+    return quote(str(value), safe='')
+
+
+def partition_dir(root, partition_by, values):
+    """
+    Folder for one combination of partition values, e.g. root/department=Engineering.
+    """
+    path = Path(root)
+    for column, value in zip(partition_by, values):
+        path = path / f"{column}={_partition_value(value)}"
+    return path
+
+
+# Part 1: Writing
+
+class PartitionedWriter:
+    """
+    Routes rows into column=value folders while streaming.
+
+    Example:
+        with PartitionedWriter('employees', partition_by=['department']) as writer:
+            writer.write_rows(rows_as_dicts)
+            writer.write_frame(df)
+
+    Parameters:
+    root : str or Path
+        Output folder
+    partition_by : list of str
+        Columns that decide the folder (in nesting order)
+    fieldnames : list of str, optional
+        All columns (taken from the first dict / DataFrame if not given)
+    max_open_files : int
+        Upper limit on simultaneously open CSV files
+    file_format : str
+        'csv' (streaming, rows or frames) or 'parquet' (frames only,
+        one new part file per write_frame call and partition)
+    encoding : str
+        Text encoding of the CSV parts
+    """
+
+    def __init__(self, root, partition_by, fieldnames=None,
+                 max_open_files=DEFAULT_MAX_OPEN_FILES, file_format='csv', encoding='utf-8'):
+        if file_format not in ('csv', 'parquet'):
+            raise ValueError(f"file_format must be 'csv' or 'parquet', got {file_format!r}")
+        self.root = Path(root)
+        self.partition_by = list(partition_by)
+        self.max_open_files = max_open_files
+        self.file_format = file_format
+        self.encoding = encoding
+        self.fieldnames = None
+        self._data_columns = None
+        if fieldnames is not None:
+            self._set_fieldnames(fieldnames)
+
+        self._open_files = OrderedDict()    # partition values -> (file, csv.writer)
+        self._part_paths = {}               # partition values -> part file of this writer
+        self.rows_written = 0
+
+    def _set_fieldnames(self, fieldnames):
+        self.fieldnames = list(fieldnames)
+        missing = [column for column in self.partition_by if column not in self.fieldnames]
+        if missing:
+            raise ValueError(f"Partition columns {missing} are not in the columns {self.fieldnames}")
+        self._data_columns = [c for c in self.fieldnames if c not in self.partition_by]
+
+    def _new_part_path(self, directory, extension):
+        directory.mkdir(parents=True, exist_ok=True)
+        number = 0
+        while (directory / f"part-{number:04d}{extension}").exists():
+            number += 1
+        return directory / f"part-{number:04d}{extension}"
+
+    def _writer_for(self, values):
+        """
+        Returns the csv.writer of a partition, opening (or re-opening) its file.
+        """
+        if values in self._open_files:
+            self._open_files.move_to_end(values)    # most recently used
+            return self._open_files[values][1]
+
+        # Too many open files -> close the least recently used one
+        if len(self._open_files) >= self.max_open_files:
+            _, (old_file, _) = self._open_files.popitem(last=False)
+            old_file.close()
+
+        if values not in self._part_paths:
+            directory = partition_dir(self.root, self.partition_by, values)
+            self._part_paths[values] = self._new_part_path(directory, '.csv')
+        path = self._part_paths[values]
+
+        is_new = not path.exists()
+        f = open(path, 'a', newline='', encoding=self.encoding)
+        writer = csv.writer(f, lineterminator='\n')
+        if is_new:
+            writer.writerow(self._data_columns)
+        self._open_files[values] = (f, writer)
+        return writer
+
+    def write_rows(self, rows):
+        """
+        Writes dict rows, each to the folder of its partition values.
+        """
+        if self.file_format != 'csv':
+            raise ValueError("write_rows() needs file_format='csv'; use write_frame() for parquet")
+        for row in rows:
+            if self.fieldnames is None:
+                self._set_fieldnames(row)
+            values = tuple(row.get(column) for column in self.partition_by)
+            self._writer_for(values).writerow([row.get(c, '') for c in self._data_columns])
+            self.rows_written += 1
+
+    def write_frame(self, frame):
+        """
+        Writes a DataFrame, one block per partition.
+        """
+        if self.fieldnames is None:
+            self._set_fieldnames([str(column) for column in frame.columns])
+        groups = frame.groupby(self.partition_by, dropna=False, sort=False)
+        for values, group in groups:
+            values = values if isinstance(values, tuple) else (values,)
+            data = group[self._data_columns]
+            if self.file_format == 'parquet':
+                directory = partition_dir(self.root, self.partition_by, values)
+                data.to_parquet(self._new_part_path(directory, '.parquet'), index=False)
+            else:
+                writer = self._writer_for(values)
+                writer.writerows(data.itertuples(index=False, name=None))
+            self.rows_written += len(group)
+
+    def close(self):
+        for f, _ in self._open_files.values():
+            f.close()
+        self._open_files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+
+# Part 2: Reading with partition pruning
+
+def _parse_partition(name):
+    column, _, raw_value = name.partition('=')
+    return column, (None if raw_value == NULL_PARTITION else unquote(raw_value))
+
+
+def _convert_like(value, sample):
+    """
+    Converts a folder-name string to the type of the filter value.
+
+    Raises ValueError (or TypeError) when the text doesn't fit that type.
+    """
+    if isinstance(sample, (bool, np.bool_)):
+        # bool('False') is True, so the words are parsed explicitly
+        lowered = value.lower()
+        if lowered in ('true', '1'):
+            return True
+        if lowered in ('false', '0'):
+            return False
+        raise ValueError(f"Not a boolean: {value!r}")
+    if isinstance(sample, numbers.Number):
+        # '42' -> 42; a float column written as '2024.0' still equals 2024
+        try:
+            return int(value)
+        except ValueError:
+            return float(value)
+    return type(sample)(value)
+
+
+def _matches(value, op, expected):
+    """
+    Compares a partition value (a string from the folder name) with a filter value.
+    """
+    if value is None:
+        return op in ('!=', 'not in') and expected is not None
+    sample = next(iter(expected), None) if op in ('in', 'not in') else expected
+    if sample is not None and not isinstance(sample, str):
+        try:
+            value = _convert_like(value, sample)
+        except (ValueError, TypeError):
+            # A value of another type can't be equal to the filter value
+            return op in ('!=', 'not in')
+    if op == 'in':
+        return value in expected
+    if op == 'not in':
+        return value not in expected
+    return bool(FILTER_OPERATORS[op](value, expected))
+
+
+def partition_files(root, filters=None):
+    """
+    Finds the data files under `root` whose partition folders pass the filters.
+
+    Filters on columns that are not partition columns are ignored here.
+
+    Returns:
+    list of (file_path, {partition column: value})
+    """
+    filters = list(filters or [])
+    found = []
+    for directory, subdirectories, files in os.walk(root):
+        relative = Path(directory).relative_to(root)
+        partitions = dict(_parse_partition(part) for part in relative.parts)
+
+        # Prune: don't even walk into folders that can't match
+        keep = []
+        for name in subdirectories:
+            column, value = _parse_partition(name)
+            if all(_matches(value, op, expected)
+                   for f_column, op, expected in filters if f_column == column):
+                keep.append(name)
+        subdirectories[:] = sorted(keep)
+
+        for name in sorted(files):
+            if name.startswith('part-') and name.endswith(('.csv', '.parquet')):
+                found.append((Path(directory) / name, partitions))
+    return found
+
+
+def read_partitioned(root, filters=None, columns=None):
+    """
+    Reads a partitioned folder into one DataFrame, touching only matching folders.
+
+    Parameters:
+    root : str or Path
+        Folder written by PartitionedWriter
+    filters : list of (column, op, value), optional
+        Partition-column filters prune folders; other filters are applied
+        to the rows of the files that are read
+    columns : list of str, optional
+        Columns to return
+    """
+    filters = list(filters or [])
+    frames = []
+    for path, partitions in partition_files(root, filters):
+        if path.suffix == '.parquet':
+            frame = pd.read_parquet(path)
+        else:
+            frame = pd.read_csv(path)
+        for column, value in partitions.items():
+            frame[column] = value
+        row_filters = [f for f in filters if f[0] not in partitions]
+        if row_filters:
+            frame = frame[filter_mask(frame, row_filters)]
+        if columns is not None:
+            frame = frame[list(columns)]
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(frames, ignore_index=True)
+
+
+if __name__ == "__main__":
+    import shutil
+
+    print("=" * 70)
+    print("PARTITIONED OUTPUT DEMO")
+    print("=" * 70)
+
+    employees = [
+        {'name': 'John Smith', 'age': 28, 'salary': 75000, 'department': 'Engineering'},
+        {'name': 'Alice Johnson', 'age': 34, 'salary': 95000, 'department': 'Data Science'},
+        {'name': 'Bob Williams', 'age': 45, 'salary': 68000, 'department': 'Marketing'},
+        {'name': 'Emma Davis', 'age': 29, 'salary': 82000, 'department': 'Engineering'},
+        {'name': 'Michael Brown', 'age': 38, 'salary': 91000, 'department': 'Data Science'},
+    ]
+
+    # max_open_files=2 forces file handles to be closed and re-opened
+    with PartitionedWriter('employees_partitioned', ['department'], max_open_files=2) as writer:
+        writer.write_rows(employees)
+
+    for path, partitions in partition_files('employees_partitioned'):
+        print(f"{path}  {partitions}")
+
+    engineers = read_partitioned('employees_partitioned',
+                                 filters=[('department', '==', 'Engineering'), ('age', '<', 35)])
+    print("\nYoung engineers (only the Engineering folder was read):")
+    print(engineers)
+
+    shutil.rmtree('employees_partitioned')
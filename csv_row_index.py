@@ -0,0 +1,306 @@
+"""
+ROW-OFFSET INDEX: RANDOM ACCESS INTO CSV FILES
+
+csv_basic.py gets single values with:
+    df.loc[0, 'name']
+    df.iloc[2]['salary']
+
+To read ONE row, the whole file is loaded first. A CSV file has no
+"table of contents": row 1,000,000 could start at any byte.
+
+The fix is to build that table of contents once:
+- scan the file a single time (through mmap, without parsing fields)
+- remember the byte offset where every record starts
+- save those offsets as a compact array of 8-byte unsigned integers
+  ('Q' = uint64) in a SIDECAR file next to the CSV: employees.csv.rowidx
+
+After that, reading row N is:
+    seek(offsets[N]) -> read until offsets[N + 1] -> parse just those bytes
+
+The scan is quote-aware: a newline inside a quoted value does not start a
+new record (see csv_parallel.py for the details).
+
+Appends are cheap: the sidecar remembers how far it has scanned (and
+whether that point was inside quotes), so only the NEW bytes are scanned.
+If the file was rewritten instead of appended to, the index is rebuilt.
+
+Sidecar layout:
+    header  : magic, scanned_upto, in_quotes, offset_count, head_hash
+    offsets : offset_count x uint64 (record start positions, header row first)
+
+"""
+
+import csv
+import hashlib
+import io
+import mmap
+import os
+import struct
+from array import array
+
+
+INDEX_SUFFIX = '.rowidx'
+INDEX_MAGIC = b'CSVROWX1'
+# magic, scanned_upto, in_quotes, offset_count, head_hash
+INDEX_HEADER = struct.Struct('<8sQQQ16s')
+
+# Bytes from the start of the CSV used to detect a rewritten file
+HEAD_HASH_BYTES = 4096
+
+
+# Part 1: Scanning record starts
+
+def scan_record_starts(buffer, position, in_quotes, quotechar=b'"'):
+    """
+    Finds where records start after `position`.
+
+    Parameters:
+    buffer : mmap or bytes
+        File contents
+    position : int
+        Offset to continue scanning from
+    in_quotes : bool
+        Whether `position` is inside a quoted field
+
+    Returns:
+    (starts, position, in_quotes)
+        starts    : array('Q') of offsets right after each record-ending newline
+        position  : offset after the last newline that was processed
+        in_quotes : quote state at that position
+    """
+    starts = array('Q')
+    while True:
+        newline = buffer.find(b'\n', position)
+        if newline == -1:
+            return starts, position, in_quotes
+        quote = buffer.find(quotechar, position, newline)
+        if quote == -1:
+            if not in_quotes:
+                starts.append(newline + 1)
+            position = newline + 1
+        else:
+            in_quotes = not in_quotes
+            position = quote + 1
+
+
+def _head_hash(buffer, scanned_upto):
+    length = min(HEAD_HASH_BYTES, scanned_upto)
+    return hashlib.blake2b(buffer[:length], digest_size=16).digest()
+
+
+def read_record(binary_file, offset, encoding='utf-8', **fmtparams):
+    """
+    Parses the single record that starts at `offset` of an open binary file.
+
+    Useful when only the start of a record is known (the end is found by
+    the csv module itself, so quoted newlines are handled).
+    """
+    binary_file.seek(offset)
+    text = io.TextIOWrapper(binary_file, encoding=encoding, newline='')
+    try:
+        return next(csv.reader(text, **fmtparams), [])
+    finally:
+        text.detach()   # keep the underlying binary file open
+
+
+# Part 2: The index
+
+class RowIndex:
+    """
+    Random access to the rows of a CSV file through an offset sidecar.
+
+    Example:
+        index = RowIndex('employees.csv')
+        print(len(index))            # number of data rows
+        print(index.header)          # ['name', 'age', ...]
+        print(index.row(0))          # ['John Smith', '28', ...]
+        print(index.rows(2, 4))      # rows 2 and 3
+
+    After rows were appended to the CSV, call index.refresh() - only the new
+    bytes are scanned.
+
+    Parameters:
+    csv_path : str or Path
+        The CSV file (first record = header)
+    index_path : str or Path, optional
+        Sidecar location (default: csv_path + '.rowidx')
+    encoding : str
+        Text encoding used when parsing rows
+    **fmtparams :
+        Passed to csv.reader (delimiter, quotechar, ...)
+    """
+
+    def __init__(self, csv_path, index_path=None, encoding='utf-8', **fmtparams):
+        self.csv_path = str(csv_path)
+        self.index_path = str(index_path or self.csv_path + INDEX_SUFFIX)
+        self.encoding = encoding
+        self.fmtparams = fmtparams
+        self._quote = fmtparams.get('quotechar', '"').encode('ascii')
+        self._offsets = array('Q')
+        self._index_map = None
+        self.refresh()
+
+    # --- building / updating ---
+
+    def _read_index_header(self):
+        if not os.path.exists(self.index_path):
+            return None
+        with open(self.index_path, 'rb') as f:
+            raw = f.read(INDEX_HEADER.size)
+        if len(raw) != INDEX_HEADER.size:
+            return None
+        magic, scanned_upto, in_quotes, count, head_hash = INDEX_HEADER.unpack(raw)
+        if magic != INDEX_MAGIC:
+            return None
+        return scanned_upto, bool(in_quotes), count, head_hash
+
+    def refresh(self):
+        """
+        Brings the sidecar up to date with the CSV file (incrementally if possible).
+        """
+        self._close_map()
+        size = os.path.getsize(self.csv_path)
+        state = self._read_index_header()
+
+        with open(self.csv_path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b''
+            try:
+                # Only trust the old index if the file grew and its start is unchanged
+                if (state is None or size < state[0]
+                        or _head_hash(buffer, state[0]) != state[3]):
+                    position, in_quotes, count = 0, False, 0
+                    new_starts = array('Q', [0]) if size else array('Q')
+                else:
+                    position, in_quotes, count, _ = state
+                    new_starts = array('Q')
+
+                starts, position, in_quotes = scan_record_starts(buffer, position, in_quotes,
+                                                                 self._quote)
+                new_starts.extend(starts)
+                head_hash = _head_hash(buffer, position)
+            finally:
+                if size:
+                    buffer.close()
+
+        mode = 'r+b' if count else 'wb'
+        with open(self.index_path, mode) as f:
+            # Offsets first, header last: a crash in between leaves the old,
+            # still consistent header in place
+            f.seek(INDEX_HEADER.size + count * 8)
+            new_starts.tofile(f)
+            f.truncate()
+            f.seek(0)
+            f.write(INDEX_HEADER.pack(INDEX_MAGIC, position, int(in_quotes),
+                                      count + len(new_starts), head_hash))
+
+        self._size = size
+        self._open_map()
+
+    def _open_map(self):
+        # The offsets are used straight from the sidecar through mmap:
+        # nothing is loaded or copied
+        with open(self.index_path, 'rb') as f:
+            self._index_map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        count = self._read_index_header()[2]
+        self._offsets = memoryview(self._index_map)[INDEX_HEADER.size:].cast('Q')[:count]
+
+        # A trailing start offset equal to the file size is not a row (yet)
+        records = count
+        if records and self._offsets[records - 1] >= self._size:
+            records -= 1
+        self._records = records
+        self.header = self._parse(0, 1)[0] if records else []
+
+    def _close_map(self):
+        if self._index_map is not None:
+            self._offsets.release()
+            self._index_map.close()
+            self._index_map = None
+
+    def close(self):
+        self._close_map()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        self.close()
+
+    # --- reading rows ---
+
+    def __len__(self):
+        # Record 0 is the header
+        return max(self._records - 1, 0)
+
+    def _parse(self, first_record, stop_record):
+        start = self._offsets[first_record]
+        end = self._offsets[stop_record] if stop_record < self._records else self._size
+        with open(self.csv_path, 'rb') as f:
+            f.seek(start)        # one seek ...
+            data = f.read(end - start)      # ... and one read
+        text = data.decode(self.encoding)
+        return list(csv.reader(io.StringIO(text, newline=''), **self.fmtparams))
+
+    def _row_number(self, n):
+        # Negative n counts from the end, like a list
+        if not -len(self) <= n < len(self):
+            raise IndexError(f"row {n} out of range (file has {len(self)} rows)")
+        return n + len(self) if n < 0 else n
+
+    def row(self, n):
+        """
+        Returns data row n (0-based, header excluded) as a list of strings.
+        """
+        n = self._row_number(n)
+        return self._parse(n + 1, n + 2)[0]
+
+    def rows(self, start, stop):
+        """
+        Returns data rows [start, stop) with a single read.
+        """
+        start, stop, _ = slice(start, stop).indices(len(self))
+        if start >= stop:
+            return []
+        return self._parse(start + 1, stop + 1)
+
+    def row_dict(self, n):
+        return dict(zip(self.header, self.row(n)))
+
+    def record_offset(self, n):
+        """
+        Byte offset where data row n starts in the CSV file.
+        """
+        return self._offsets[self._row_number(n) + 1]
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("ROW-OFFSET INDEX DEMO")
+    print("=" * 70)
+
+    sample_csv_content = """name,age,city,salary,department
+John Smith,28,New York,75000,Engineering
+Alice Johnson,34,San Francisco,95000,Data Science
+Bob Williams,45,Chicago,68000,Marketing
+"Emma Davis",29,"Boston
+(remote)",82000,Engineering
+"""
+
+    with open('employees_indexed.csv', 'w') as f:
+        f.write(sample_csv_content)
+
+    index = RowIndex('employees_indexed.csv')
+    print(f"Rows: {len(index)}")
+    print(f"First employee's name: {index.row_dict(0)['name']}")
+    print(f"Salary at row 2: {index.row_dict(2)['salary']}")
+    print(f"Row 3 (quoted newline): {index.row(3)}")
+
+    # Append rows and update the index incrementally
+    with open('employees_indexed.csv', 'a') as f:
+        f.write("Michael Brown,38,Seattle,91000,Data Science\n")
+    index.refresh()
+    print(f"\nAfter append: {len(index)} rows, last row: {index.row(-1)}")
+
+    index.close()
+    os.remove('employees_indexed.csv')
+    os.remove('employees_indexed.csv' + INDEX_SUFFIX)
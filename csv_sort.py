@@ -0,0 +1,222 @@
+"""
+TOP-K QUERIES AND EXTERNAL MERGE SORT FOR LARGE CSV FILES
+
+Section 7 of csv_basic.py does:
+    print(df.sort_values('salary', ascending=False))
+
+Two problems on a big file:
+1. Usually we only LOOK at the first few rows ("top 10 salaries"),
+   but the whole file is loaded and fully sorted.
+2. A file bigger than RAM can't be sorted with pandas at all.
+
+Solution 1: TOP-K WITH A HEAP
+Keep only the k best rows seen so far in a heap (a tree where the "worst of
+the best" is always on top). Each new row is compared with that worst one:
+- better? replace it (O(log k))
+- worse?  skip it   (O(1))
+Total: O(n log k) time and memory for just k rows.
+
+Solution 2: EXTERNAL MERGE SORT
+1. Read as many rows as fit in memory (a "run"), sort them, write them to
+   a temporary file. Repeat until the input is done.
+2. Open all runs at once and repeatedly take the smallest head row
+   (a k-way merge with heapq.merge). The output comes out sorted while
+   only one row per run is in memory.
+
+"""
+
+import csv
+import heapq
+import itertools
+import os
+import pickle
+import tempfile
+
+
+# Rows (or items) kept in memory per sorted run
+DEFAULT_RUN_SIZE = 1_000_000
+
+
+# Part 1: Sort keys for CSV columns
+
+def column_sort_key(index, key_type=str, reverse=False):
+    """
+    Builds a key function for rows (lists) that sorts on one column.
+
+    Empty values always end up LAST, like pandas' na_position='last',
+    whether the sort is ascending or descending.
+    """
+    missing_value = key_type()      # '' / 0 / 0.0 - just something comparable
+    missing_flag, present_flag = (0, 1) if reverse else (1, 0)
+
+    def key(row):
+        value = row[index] if index < len(row) else ''
+        if value == '':
+            return (missing_flag, missing_value)
+        return (present_flag, key_type(value))
+
+    return key
+
+
+def _open_rows(path, encoding, fmtparams):
+    f = open(path, 'r', newline='', encoding=encoding)
+    reader = csv.reader(f, **fmtparams)
+    header = next(reader)
+    return f, header, reader
+
+
+# Part 2: Top-k
+
+def top_k(path, column, k, largest=True, key_type=float, encoding='utf-8', **fmtparams):
+    """
+    Returns the k rows with the highest (or lowest) values in a column.
+
+    Parameters:
+    path : str or Path
+        CSV file with a header row
+    column : str
+        Column to rank by
+    k : int
+        Number of rows to return
+    largest : bool
+        True for the highest values, False for the lowest
+    key_type : type
+        How to compare values (float, int or str)
+
+    Returns:
+    (header, rows) - rows are lists of strings, best first
+    """
+    f, header, reader = _open_rows(path, encoding, fmtparams)
+    with f:
+        index = header.index(column)
+        convert = column_sort_key(index, key_type)
+        rows = (row for row in reader if index < len(row) and row[index] != '')
+        # nlargest / nsmallest keep a heap of only k items
+        select = heapq.nlargest if largest else heapq.nsmallest
+        return header, select(k, rows, key=lambda row: convert(row)[1])
+
+
+# Part 3: External merge sort
+
+def _write_run(items, directory):
+    run = tempfile.NamedTemporaryFile(mode='wb', dir=directory, prefix='sort-run-',
+                                      suffix='.pkl', delete=False)
+    with run:
+        dump = pickle.Pickler(run, protocol=pickle.HIGHEST_PROTOCOL).dump
+        for item in items:
+            dump(item)
+    return run.name
+
+
+def _read_run(run_path):
+    with open(run_path, 'rb') as f:
+        unpickler = pickle.Unpickler(f)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+
+
+def sorted_stream(items, key=None, reverse=False, run_size=DEFAULT_RUN_SIZE, tmp_dir=None):
+    """
+    Sorts any iterable of picklable items with bounded memory.
+
+    Items are sorted in runs of `run_size`, spilled to temporary files and
+    merged lazily. If everything fits in one run, no file is written.
+
+    Yields the items in sorted order. Temporary files are removed when the
+    generator finishes (or is closed early).
+    """
+    items = iter(items)
+    run_paths = []
+    try:
+        while True:
+            run = list(itertools.islice(items, run_size))
+            if not run:
+                break
+            run.sort(key=key, reverse=reverse)
+            if not run_paths and len(run) < run_size:
+                # Small input: sorted entirely in memory
+                yield from run
+                return
+            run_paths.append(_write_run(run, tmp_dir))
+            del run
+
+        runs = [_read_run(run_path) for run_path in run_paths]
+        yield from heapq.merge(*runs, key=key, reverse=reverse)
+    finally:
+        for run_path in run_paths:
+            if os.path.exists(run_path):
+                os.remove(run_path)
+
+
+def external_sort(path, out_path, column, key_type=str, reverse=False,
+                  run_size=DEFAULT_RUN_SIZE, tmp_dir=None, encoding='utf-8', **fmtparams):
+    """
+    Sorts a CSV file by one column into a new CSV file, without pandas.
+
+    Parameters:
+    path : str or Path
+        Input CSV with a header row
+    out_path : str or Path
+        Where to write the sorted CSV
+    column : str
+        Column to sort by
+    key_type : type
+        float / int for numeric order, str for text order
+    reverse : bool
+        True for descending order
+    run_size : int
+        Rows held in memory per sorted run
+    tmp_dir : str, optional
+        Directory for the temporary runs (default: system temp dir)
+
+    Returns:
+    int: number of data rows written
+    """
+    f, header, reader = _open_rows(path, encoding, fmtparams)
+    written = 0
+    with f, open(out_path, 'w', newline='', encoding=encoding) as out:
+        writer = csv.writer(out, **fmtparams)
+        writer.writerow(header)
+        key = column_sort_key(header.index(column), key_type, reverse)
+        # Stable sort + stable merge: equal keys keep their original order
+        for row in sorted_stream(reader, key=key, reverse=reverse, run_size=run_size,
+                                 tmp_dir=tmp_dir):
+            writer.writerow(row)
+            written += 1
+    return written
+
+
+if __name__ == "__main__":
+    print("=" * 70)
+    print("TOP-K AND EXTERNAL SORT DEMO")
+    print("=" * 70)
+
+    sample_csv_content = """name,age,city,salary,department
+John Smith,28,New York,75000,Engineering
+Alice Johnson,34,San Francisco,95000,Data Science
+Bob Williams,45,Chicago,68000,Marketing
+Emma Davis,29,Boston,82000,Engineering
+Michael Brown,38,Seattle,91000,Data Science
+Sarah Wilson,31,Austin,77000,Marketing
+David Lee,42,Denver,88000,Engineering"""
+
+    with open('employees.csv', 'w') as f:
+        f.write(sample_csv_content)
+
+    header, best_paid = top_k('employees.csv', 'salary', k=3)
+    print("\nTop 3 salaries:")
+    for row in best_paid:
+        print(f"  {row}")
+
+    # run_size=2 forces several runs on disk, just to show the merge
+    external_sort('employees.csv', 'employees_sorted.csv', 'salary', key_type=float,
+                  reverse=True, run_size=2)
+    print("\nExternally sorted by salary (descending):")
+    with open('employees_sorted.csv') as f:
+        print(f.read())
+
+    os.remove('employees.csv')
+    os.remove('employees_sorted.csv')
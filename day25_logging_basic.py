@@ -27,8 +27,12 @@ Read this thinking: "I am learning to make my code observable."
 """
 
 
+import json
 import logging
+import math
+import re
 import sys
+import time
 from datetime import datetime
 
 # Part 1: Why print() is not enough
@@ -251,26 +255,26 @@ def demonstrate_appropiate_levels():
         User registration with appropiate logging at each step.
         """
 
-        logger.info(f"Registration attempt for username: {username}")
+        logger.info("Registration attempt for username: %s", username)
 
 
         # Validation
         if not email or '@' not in email:
-            logger.error(f"Registration failed: invalid email '{email}'")
+            logger.error("Registration failed: invalid email '%s'", email)
             return False
         
         if age < 13:
-            logger.warning(f"Registration blocked: age {age} below minimum")
+            logger.warning("Registration blocked: age %s below minimum", age)
             return False
         
         # Simulate: Chek if username taken
-        logger.debug(f"Checking username availability: {username}")
+        logger.debug("Checking username availability: %s", username)
 
         # Simulate: create user in database
-        logger.debug(f"Inserting user record: {username}, {email}")
+        logger.debug("Inserting user record: %s, %s", username, email)
 
         # Sucess
-        logger.info(f"User registered sucessfully: {username}")
+        logger.info("User registered sucessfully: %s", username)
         return True
     
     # Test cases
@@ -452,7 +456,7 @@ def demonstrate_exception_logging():
             return None
         
         except (ValueError, TypeError) as e:
-            logger.exception(f"Data type error: {e}")
+            logger.exception("Data type error: %s", e)
             return None
         
         except ZeroDivisionError as e:
@@ -510,38 +514,38 @@ def demonstrate_logging_best_practices():
         
         """
 
-        logger.info(f"Processing data for user {user_id}")
-        logger.debug(f"Input data: {data}")
+        logger.info("Processing data for user %s", user_id)
+        logger.debug("Input data: %s", data)    # formatted only if DEBUG is on (Part 7)
 
 
         try:
             # Validation
             if not isinstance(data, dict):
-                logger.error(f"Invalid data type: expected dict, got {type(data)}")
+                logger.error("Invalid data type: expected dict, got %s", type(data))
                 return False
             
             required_fields = ['name', 'email']
             missing = [f for f in required_fields if f not in data]
             if missing:
-                logger.warning(f"Missing optional fields: {missing}")
+                logger.warning("Missing optional fields: %s", missing)
 
             # Processing
-            logger.debug(f"Validating email: {data.get('email')}")
+            logger.debug("Validating email: %s", data.get('email'))
 
             if '@' not in data.get('email', ''):
-                logger.error(f"Invalid email format: {data.get('email')}")
+                logger.error("Invalid email format: %s", data.get('email'))
                 return False
             
             # Simulate database operation
-            logger.debug(f"Saving to database: user {user_id}")
+            logger.debug("Saving to database: user %s", user_id)
 
             # Sucess
-            logger.info(f"User {user_id} processed successfully")
+            logger.info("User %s processed successfully", user_id)
             return True
         
         except Exception as e:
             # Unexpected error - log with full traceback
-            logger.exception(f"Unexpected error processing user {user_id}")
+            logger.exception("Unexpected error processing user %s", user_id)
             return False
         
 
@@ -609,8 +613,8 @@ def demonstrate_print_vs_logging():
 
 
     # Logging fot what the program does
-    logger.info(f"User {user_name} started session")
-    logger.debug(f"Loading uset preferences for {user_name}")
+    logger.info("User %s started session", user_name)
+    logger.debug("Loading uset preferences for %s", user_name)
 
     print("\n=== Background Process Example ===")
     # No print() here - it's a background process, no user watching
@@ -625,6 +629,387 @@ def demonstrate_print_vs_logging():
     print("- logging = talking ABOUT the program")
 
 
+# Part 7: Logging in hot loops - don't pay for messages nobody sees
+
+
+"""
+An f-string is built BEFORE the logger is called:
+
+    logger.debug(f"Input data: {data}")
+
+Even with DEBUG switched off, str(data) runs on every call. Inside a loop
+with a big payload, that is most of the loop's time - for nothing.
+
+Ways to make disabled calls (almost) free:
+
+1. %-style arguments (built into logging):
+       logger.debug("Input data: %s", data)
+   The message is only formatted when a handler actually writes it.
+
+2. lazy() for arguments that are expensive to COMPUTE, not just to format:
+       logger.debug("Stats: %s", lazy(lambda: summarize(data)))
+   summarize() only runs if the message is written.
+
+3. LazyFormat for {}-style templates (easy to migrate from f-strings):
+       logger.debug(LazyFormat("Input data: {}", data))
+
+4. LazyLogger: remembers which levels are on. A disabled method is
+   replaced by a function that does nothing, so the call skips even the
+   logger's own level check.
+
+"""
+
+
+class lazy:
+    """
+    Defers computing a log argument until the message is formatted.
+
+    Parameters:
+    func : callable
+        Called without arguments; its result is what gets logged
+    """
+
+    __slots__ = ('func',)
+
+    def __init__(self, func):
+        self.func = func
+
+    def __str__(self):
+        return str(self.func())
+
+    def __repr__(self):
+        return repr(self.func())
+
+
+class LazyFormat:
+    """
+    A str.format() template, formatted only when the message is written.
+    """
+
+    __slots__ = ('template', 'args', 'kwargs')
+
+    def __init__(self, template, *args, **kwargs):
+        self.template = template
+        self.args = args
+        self.kwargs = kwargs
+
+    def __str__(self):
+        return self.template.format(*self.args, **self.kwargs)
+
+
+def _disabled(*args, **kwargs):
+    pass
+
+
+class LazyLogger:
+    """
+    Logger facade with cached level checks.
+
+    Methods of disabled levels are no-ops, so a disabled call costs one
+    empty function call. Levels changed through set_level() refresh the
+    cache; after changing levels any other way (another handler setup,
+    logging.disable(), ...) call refresh().
+
+    Parameters:
+    logger : logging.Logger or str
+        The logger to wrap (or its name)
+    """
+
+    LEVELS = {
+        'debug': logging.DEBUG,
+        'info': logging.INFO,
+        'warning': logging.WARNING,
+        'error': logging.ERROR,
+        'critical': logging.CRITICAL,
+    }
+
+    def __init__(self, logger):
+        self.logger = logging.getLogger(logger) if isinstance(logger, str) else logger
+        self.refresh()
+
+    def refresh(self):
+        for name, level in self.LEVELS.items():
+            enabled = self.logger.isEnabledFor(level)
+            setattr(self, f"{name}_enabled", enabled)
+            # The logger's own bound method when enabled, a no-op otherwise
+            setattr(self, name, getattr(self.logger, name) if enabled else _disabled)
+        self.exception = self.logger.exception if self.error_enabled else _disabled
+
+    def set_level(self, level):
+        self.logger.setLevel(level)
+        self.refresh()
+
+
+def benchmark_disabled_logging(calls=100_000, payload_size=1_000):
+    """
+    Time per DISABLED debug call with a large payload, for each style.
+
+    Returns:
+    dict: {style: nanoseconds per call}
+    """
+    logger = logging.getLogger('lazy_benchmark')
+    logger.setLevel(logging.INFO)   # DEBUG is off
+    fast = LazyLogger(logger)
+    data = {'rows': list(range(payload_size))}
+
+    styles = {
+        'f-string': lambda: logger.debug(f"Input data: {data}"),
+        '%-args': lambda: logger.debug("Input data: %s", data),
+        'lazy()': lambda: logger.debug("Input data: %s", lazy(lambda: sorted(data['rows']))),
+        'LazyFormat': lambda: logger.debug(LazyFormat("Input data: {}", data)),
+        'LazyLogger': lambda: fast.debug("Input data: %s", data),
+    }
+    results = {}
+    for style, call in styles.items():
+        start = time.perf_counter()
+        for _ in range(calls):
+            call()
+        results[style] = (time.perf_counter() - start) / calls * 1e9
+        print(f"{style:<12} {results[style]:10.1f} ns per call")
+    return results
+
+
+def demonstrate_lazy_logging():
+    """
+    Shows that lazy messages are still complete when they ARE written.
+    """
+    print("\n--- LAZY LOGGING IN HOT LOOPS ---")
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(levelname)s: %(message)s',
+        force=True
+    )
+
+    log = LazyLogger('hot_loop')
+    batch = list(range(10))
+
+    log.debug("Batch contents: %s", batch)  # DEBUG off -> nothing is formatted
+    log.info("Batch size: %d, total: %s", len(batch), lazy(lambda: sum(batch)))
+    log.info(LazyFormat("First item: {first}, last item: {last}", first=batch[0], last=batch[-1]))
+
+    log.set_level(logging.DEBUG)
+    log.debug("Now DEBUG is on: %s", batch)
+
+    print("\nCost of one DISABLED debug call with a 1,000-item payload:")
+    benchmark_disabled_logging()
+
+
+# Part 8: Structured logs - one JSON object per line
+
+
+"""
+A text line like
+
+    2024-05-01 12:00:00,123 [ERROR] payments: Card declined
+
+is easy to READ but hard to PROCESS: a log pipeline needs a regex per
+format to pull the fields back out, and context (user id, request id)
+ends up glued into the message text.
+
+JSON lines write every record as one JSON object:
+
+    {"asctime":"2024-05-01 12:00:00,123","levelname":"ERROR","name":"payments",
+     "message":"Card declined","user_id":42}
+
+- Every tool can read it back with json.loads (no regex)
+- Context passed with extra={...} becomes its own field
+
+Keeping it as fast as the text formatter:
+- the '"key":' part of every field is encoded once, not per record
+- the timestamp up to the second is formatted once per second
+  (logging.Formatter calls time.strftime for EVERY record)
+- the record is read directly, no dict is copied or built per record
+
+"""
+
+# Attributes every LogRecord has - anything else on a record came from extra={...}
+_RECORD_ATTRIBUTES = frozenset(
+    logging.LogRecord('', logging.INFO, '', 0, '', (), None).__dict__
+) | {'message', 'asctime'}
+
+_encode_string = json.encoder.encode_basestring     # the C version when available
+
+
+def _encode_float(value):
+    # NaN and +-inf have no JSON spelling (json.dumps would write bare NaN)
+    return float.__repr__(value) if math.isfinite(value) else 'null'
+
+
+# Encoders for the common value types; everything else goes through json.JSONEncoder
+_FAST_ENCODERS = {
+    str: _encode_string,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+}
+
+
+# '000' ... '999': milliseconds without a format call per record
+_MILLISECONDS = ['%03d' % ms for ms in range(1000)]
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """
+    Formats each record as a single-line JSON object.
+
+    Parameters:
+    fields : sequence of str
+        Record attributes to write, in this order ('asctime' and 'message'
+        are computed like logging.Formatter does)
+    include_extra : bool
+        Also write the fields passed with extra={...}
+    datefmt : str
+        time.strftime format for 'asctime' (milliseconds are appended)
+    """
+
+    def __init__(self, fields=('asctime', 'levelname', 'name', 'message'),
+                 include_extra=True, datefmt='%Y-%m-%d %H:%M:%S'):
+        super().__init__(datefmt=datefmt)
+        self.fields = tuple(fields)
+        self.include_extra = include_extra
+        self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'),
+                                         allow_nan=False, default=str)
+        self._extra_keys = {}
+        # Names already written as fields are not repeated as extras
+        self._not_extra = _RECORD_ATTRIBUTES | set(self.fields)
+        # (second, text) in ONE attribute: threads swap it atomically, so a
+        # reader never pairs one thread's second with another thread's text
+        self._second_cache = (None, '')
+
+        # One function per field that reads its value from the record, and a
+        # template with every '"key":' already encoded
+        special = {'message': logging.LogRecord.getMessage, 'asctime': self._timestamp}
+        self._readers = [
+            special.get(field) or (lambda record, field=field: getattr(record, field, None))
+            for field in self.fields
+        ]
+        self._template = '{' + ','.join(_encode_string(field) + ':%s' for field in self.fields)
+
+    def _timestamp(self, record):
+        second = int(record.created)
+        cached_second, text = self._second_cache
+        if second != cached_second:
+            text = time.strftime(self.datefmt, self.converter(second)) + ','
+            self._second_cache = (second, text)
+        return text + _MILLISECONDS[int(record.msecs)]
+
+    def _encode_other(self, value):
+        if isinstance(value, float):    # float subclasses, e.g. numpy.float64
+            return _encode_float(value)
+        try:
+            return self._encoder.encode(value)
+        except ValueError:
+            # NaN inside a container, or a circular reference: keep the line valid JSON
+            return _encode_string(str(value))
+
+    def _extra_key(self, name):
+        key = self._extra_keys.get(name)
+        if key is None:
+            key = self._extra_keys[name] = ',' + _encode_string(name) + ':'
+        return key
+
+    def format(self, record):
+        encode_other = self._encode_other
+        encoded = []
+        for read in self._readers:
+            value = read(record)
+            encoder = _FAST_ENCODERS.get(value.__class__, encode_other)
+            encoded.append(encoder(value))
+        line = self._template % tuple(encoded)
+
+        if self.include_extra:
+            values = record.__dict__
+            not_extra = self._not_extra
+            for name in [name for name in values if name not in not_extra]:
+                value = values[name]
+                encoder = _FAST_ENCODERS.get(value.__class__, encode_other)
+                line += self._extra_key(name) + encoder(value)
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += ',"exc_info":' + _encode_string(record.exc_text)
+        if record.stack_info:
+            line += ',"stack_info":' + _encode_string(record.stack_info)
+        if not self.fields:
+            line = '{' + line[2:]   # no leading comma before the first extra field
+        return line + '}'
+
+
+TEXT_LINE_PATTERN = re.compile(
+    r'^(?P<asctime>\S+ \S+) \[(?P<levelname>\w+)\] (?P<name>[^:]+): (?P<message>.*)$'
+)
+
+
+def benchmark_formatters(records=50_000):
+    """
+    Formats the same records as text and as JSON lines, then parses both back.
+
+    Parsing back is SLOWER for JSON: json.loads takes about twice as long
+    as one fixed regex per line. But the regex only gets four fields back -
+    request_id was never written - while json.loads returns every field,
+    with one parser for all formats.
+
+    Returns:
+    dict: {step: seconds}
+    """
+    text_formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(name)s: %(message)s')
+    json_formatter = JSONLinesFormatter()
+    logger = logging.getLogger('payments')
+    batch = [
+        logger.makeRecord('payments', logging.INFO, __file__, 0,
+                          'Charged user %s: %.2f EUR', (i, i * 0.5), None,
+                          extra={'request_id': f"req-{i}"})
+        for i in range(records)
+    ]
+
+    results = {}
+    for label, formatter in (('text', text_formatter), ('json', json_formatter)):
+        start = time.perf_counter()
+        lines = [formatter.format(record) for record in batch]
+        results[f"format {label}"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        if label == 'text':
+            parsed = [TEXT_LINE_PATTERN.match(line).groupdict() for line in lines]
+        else:
+            parsed = [json.loads(line) for line in lines]
+        results[f"parse {label}"] = time.perf_counter() - start
+
+    for step, seconds in results.items():
+        print(f"{step:<12} {seconds / records * 1e6:8.2f} us per record")
+    return results
+
+
+def demonstrate_json_logging():
+    """
+    Shows JSON-lines output, including extra context and exceptions.
+    """
+    print("\n--- STRUCTURED (JSON LINES) LOGGING ---")
+
+    logger = logging.getLogger('payments')
+    logger.setLevel(logging.INFO)
+    logger.handlers.clear()
+    logger.propagate = False    # Don't also print through basicConfig's handler
+
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(JSONLinesFormatter())
+    logger.addHandler(handler)
+
+    logger.info("Payment received: %.2f EUR", 19.99, extra={'user_id': 42, 'request_id': 'req-7'})
+    logger.warning("Card expires soon", extra={'user_id': 42, 'months_left': 1})
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logger.exception("Fee calculation failed", extra={'user_id': 42})
+
+    print("\nText vs JSON lines (format, then parse back):")
+    benchmark_formatters()
+
+
 # MAIN DEMONSTRATION
 
 
@@ -654,6 +1039,12 @@ if __name__ == "__main__":
     # Demo 6: Print vs Logging
     demonstrate_print_vs_logging()
 
+    # Demo 7: Lazy logging in hot loops
+    demonstrate_lazy_logging()
+
+    # Demo 8: Structured JSON logging
+    demonstrate_json_logging()
+
 
     print("\n" + "=" * 70)
     print("KEY TAKEAWAYS:")
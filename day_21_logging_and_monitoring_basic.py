@@ -12,6 +12,10 @@ performance optimization
 # IMPORTS AND SETUP
 
 import logging # Python's built-in logging framework - the foundation of tracking program behavior
+import logging.handlers # QueueHandler/QueueListener for non-blocking logging
+import queue # Thread-safe queue between the training thread and the logging thread
+import atexit # For flushing queued log records when the program exits
+import os # For removing benchmark log files
 import time # For measuring execution time and simulating delays
 import numpy as np # For numerical operations and creating sample datasets
 import functools as wraps # For creating decorators - functions that modify other functions
@@ -107,7 +111,73 @@ CRITICAL (50): A very serious error that may cause program termination
 """
 
 
-def setup_ml_logger(experiment_name, log_level=logging.INFO):
+"""
+NON-BLOCKING LOGGING WITH A QUEUE
+
+Every logger.info() call normally WRITES to the terminal and to the file
+right away, on the thread that called it. In a training loop that means
+the loop waits for disk and terminal I/O on every step.
+
+With a queue, the work is split:
+    training thread  -> QueueHandler  : puts the record into a queue (fast)
+    logging thread   -> QueueListener : takes records out and writes them
+                                        with the real handlers
+
+The queue is BOUNDED (so a burst of logs can't eat all memory). When it is
+full, a policy decides what happens:
+    'block' : wait until there is space (no record is lost)
+    'drop'  : throw the record away and count it (the loop never waits)
+
+At shutdown the listener writes everything still in the queue.
+"""
+
+QUEUE_POLICIES = ('block', 'drop')
+
+
+class BoundedQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler with a full-queue policy ('block' or 'drop').
+
+    Dropped records are counted in `self.dropped`.
+    """
+
+    def __init__(self, log_queue, policy='block'):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"policy must be one of {QUEUE_POLICIES}, got {policy!r}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+
+    def enqueue(self, record):
+        if self.policy == 'block':
+            self.queue.put(record) # Waits while the queue is full
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class DrainingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener whose stop() also works when the queue is full.
+
+    The standard listener puts its stop marker with put_nowait(), which fails
+    on a full bounded queue. Here it waits - the listener thread keeps
+    emptying the queue, so space comes quickly.
+    """
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+    def stop(self):
+        # Safe to call twice (shutdown_ml_logger() and then atexit)
+        if self._thread is not None:
+            super().stop()
+
+
+def setup_ml_logger(experiment_name, log_level=logging.INFO, use_queue=False,
+                    queue_size=10_000, queue_policy='block'):
     """
     Creates a customized logger for ML experiments with both file and and console output.
 
@@ -121,6 +191,16 @@ def setup_ml_logger(experiment_name, log_level=logging.INFO):
     log_level : int
         Minimum severity level to log (default: INFO)
 
+    use_queue : bool
+        If True, log calls only put records into a queue; a background
+        thread (QueueListener) does the console and file writing
+
+    queue_size : int
+        Maximum number of records waiting in the queue (use_queue=True)
+
+    queue_policy : str
+        What happens when the queue is full: 'block' or 'drop'
+
     Returns:
     logger: logging.Logger
        Configure logger ready for use
@@ -146,7 +226,8 @@ def setup_ml_logger(experiment_name, log_level=logging.INFO):
 
     # Step 3: Clear any existing hanflers (prevents duplicate logs)
     # This is important if the function is called multiple times
-    logger.handlers = []
+    # shutdown_ml_logger also stops the listener thread of an earlier use_queue=True call
+    shutdown_ml_logger(logger)
 
     # Step 4: Create a CONSOLE HANDLER (for real-time monitoring)
     # StreamHandler writes to sys.stdout (yout terminal/console)
@@ -156,8 +237,8 @@ def setup_ml_logger(experiment_name, log_level=logging.INFO):
     # Step 5: Creat a FILE HANDLER ( for permanent records)
     # FileHandler writes to a file on disk
     # Using timestamp in filenmae ensires each run creates a unique log file
-    log_filename = f"ml_experiment_{experiment_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-    file_handler = logging.FileHandler(log_filename, mode='W') # ''W' = overwrite if exists
+    log_filename = f"ml_experiment_{experiment_name}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+    file_handler = logging.FileHandler(log_filename, mode='w') # 'w' = overwrite if exists
     file_handler.setLevel(logging.DEBUG) # File captures EVRYTHING (including DEBUG)
 
 
@@ -181,16 +262,102 @@ def setup_ml_logger(experiment_name, log_level=logging.INFO):
 
     # Step 8: Attach handlers to logger
     # Now our logger will output to BOTH console and file
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    if use_queue:
+        # The logger only gets the QueueHandler; the listener thread owns the
+        # real handlers (respect_handler_level keeps their levels working)
+        log_queue = queue.Queue(maxsize=queue_size)
+        queue_handler = BoundedQueueHandler(log_queue, policy=queue_policy)
+        listener = DrainingQueueListener(log_queue, console_handler, file_handler,
+                                         respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop) # Write what is left in the queue at exit
+        logger.addHandler(queue_handler)
+        logger.queue_listener = listener
+        logger.queue_handler = queue_handler
+    else:
+        logger.addHandler(console_handler)
+        logger.addHandler(file_handler)
 
     # Log the logger creation itself (meta-logging!)
-    logger.info(f"Logger initialized for experiment: {experiment_name}")
-    logger.info(f"Log file created: {log_filename}")
+    logger.info("Logger initialized for experiment: %s", experiment_name)
+    logger.info("Log file created: %s", log_filename)
+    logger.log_filename = log_filename
 
     return logger
 
 
+def shutdown_ml_logger(logger):
+    """
+    Flushes and closes a logger created by setup_ml_logger().
+
+    With use_queue=True the listener first writes every queued record,
+    then its thread stops.
+
+    Returns:
+    int: number of records dropped because the queue was full
+    """
+    listener = getattr(logger, 'queue_listener', None)
+    dropped = 0
+    if listener is not None:
+        listener.stop() # Blocks until the queue is empty
+        atexit.unregister(listener.stop)
+        dropped = logger.queue_handler.dropped
+        handlers = list(listener.handlers)
+        del logger.queue_listener, logger.queue_handler
+    else:
+        handlers = list(logger.handlers)
+    for handler in handlers:
+        handler.flush()
+        handler.close()
+    logger.handlers = []
+    return dropped
+
+
+def benchmark_logging_latency(calls=20_000, queue_policy='block'):
+    """
+    Measures how long ONE logger.info() call takes in a hot loop,
+    with direct handlers vs. with the queue.
+
+    The console output goes to os.devnull so the terminal doesn't slow
+    down (or flood) the measurement; the file handler writes as usual.
+
+    Returns:
+    dict: {mode: {'mean_us', 'p50_us', 'p99_us', 'max_us', 'dropped'}}
+    """
+    results = {}
+    for label, use_queue in (('direct', False), ('queue', True)):
+        with open(os.devnull, 'w') as devnull:
+            real_stdout = sys.stdout
+            sys.stdout = devnull # The console handler picks up sys.stdout when created
+            try:
+                logger = setup_ml_logger(f"latency_{label}", use_queue=use_queue,
+                                         queue_policy=queue_policy)
+            finally:
+                sys.stdout = real_stdout
+
+            latencies = np.empty(calls)
+            for step in range(calls):
+                start = time.perf_counter()
+                logger.info("step %d - loss %.4f", step, 1.0 / (step + 1))
+                latencies[step] = time.perf_counter() - start
+
+            dropped = shutdown_ml_logger(logger)
+        os.remove(logger.log_filename)
+
+        latencies *= 1e6 # seconds -> microseconds
+        results[label] = {
+            'mean_us': float(latencies.mean()),
+            'p50_us': float(np.percentile(latencies, 50)),
+            'p99_us': float(np.percentile(latencies, 99)),
+            'max_us': float(latencies.max()),
+            'dropped': dropped,
+        }
+        print(f"{label:<7} mean {results[label]['mean_us']:7.2f} us  "
+              f"p50 {results[label]['p50_us']:7.2f} us  p99 {results[label]['p99_us']:8.2f} us  "
+              f"dropped {dropped}")
+    return results
+
+
 # Part 2: Monitoring in AI/ML Workflows
 
 """
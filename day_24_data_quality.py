@@ -722,6 +722,15 @@ for idx, amount in df['purchase_amount'].items():
         print(f"Row {idx}: ${amount:.2f}, z-score={z_score:.2f}, outlier={is_outlier}")
 
 
+# Re-running with different thresholds on a big CSV?
+# Parsing the file again every time is the slow part. csv_column_cache.py
+# parses the column once, saves it as .npy and re-opens it memory-mapped:
+#
+#   cache = NumericColumnCache('.column_cache')
+#   amounts = cache.get_column('customers.csv', 'purchase_amount')
+#   outlier_rows = zscore_outliers(amounts, threshold=2.5)
+
+
 
 
 
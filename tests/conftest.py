@@ -0,0 +1,24 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# The csv_*.py modules live in the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+DEPARTMENTS = ['Engineering', 'Data Science', 'Marketing', 'Sales']
+
+
+@pytest.fixture
+def employees_csv(tmp_path):
+    """
+    500 employees with a quoted field, a quoted newline and a few missing salaries.
+    """
+    path = tmp_path / 'employees.csv'
+    with open(path, 'w', newline='') as f:
+        f.write('name,age,city,salary,department\n')
+        for i in range(500):
+            city = '"Boston,\nMA"' if i % 53 == 0 else '"Austin, TX"' if i % 7 == 0 else 'Chicago'
+            salary = '' if i % 61 == 0 else 60000 + (i * 7919) % 50000
+            f.write(f"Employee {i},{20 + i % 45},{city},{salary},{DEPARTMENTS[i % 4]}\n")
+    return path
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from csv_benchmark import check_result, generate_employees, verify_engines
+
+
+@pytest.fixture
+def generated_csv(tmp_path):
+    path = tmp_path / 'employees.csv'
+    generate_employees(path, 3000, extra_columns=2, chunk_rows=1000)
+    return path
+
+
+def test_generated_file_is_reproducible(generated_csv, tmp_path):
+    again = tmp_path / 'again.csv'
+    generate_employees(again, 3000, extra_columns=2, chunk_rows=1000)
+    frame = pd.read_csv(generated_csv)
+    assert len(frame) == 3000
+    pd.testing.assert_frame_equal(frame, pd.read_csv(again))
+
+
+def test_every_engine_matches_pandas(generated_csv):
+    verify_engines(generated_csv)
+
+
+def test_check_result_rejects_wrong_values(generated_csv):
+    expected = pd.read_csv(generated_csv, usecols=['age', 'salary'])
+    wrong = expected.assign(salary=expected['salary'] + 1)
+    with pytest.raises(ValueError):
+        check_result(wrong, expected, 'subset')
@@ -0,0 +1,23 @@
+import numpy as np
+import pandas as pd
+
+from csv_column_cache import NumericColumnCache
+
+
+def test_column_matches_pandas(employees_csv, tmp_path):
+    cache = NumericColumnCache(tmp_path / 'cache')
+    expected = pd.read_csv(employees_csv)['salary'].to_numpy(dtype=np.float64)
+
+    first = cache.get_column(employees_csv, 'salary')      # parses and writes the .npy
+    second = cache.get_column(employees_csv, 'salary')     # served from the cache
+    np.testing.assert_array_equal(first, expected)
+    np.testing.assert_array_equal(second, expected)
+
+
+def test_changed_file_is_parsed_again(employees_csv, tmp_path):
+    cache = NumericColumnCache(tmp_path / 'cache')
+    cache.get_column(employees_csv, 'age')
+    with open(employees_csv, 'a') as f:
+        f.write('Late Joiner,99,Chicago,1,Sales\n')
+    np.testing.assert_array_equal(cache.get_column(employees_csv, 'age'),
+                                  pd.read_csv(employees_csv)['age'].to_numpy(dtype=np.float64))
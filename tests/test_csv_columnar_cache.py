@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+
+from csv_columnar_cache import PYARROW_AVAILABLE, ColumnarCSVCache
+
+
+@pytest.mark.skipif(not PYARROW_AVAILABLE, reason='pyarrow is not installed')
+@pytest.mark.parametrize('file_format', ['parquet', 'feather'])
+def test_cached_frame_matches_pandas(employees_csv, tmp_path, file_format):
+    cache = ColumnarCSVCache(tmp_path / 'cache', file_format=file_format)
+    expected = pd.read_csv(employees_csv)
+
+    pd.testing.assert_frame_equal(cache.read_csv(employees_csv), expected, check_dtype=False)
+    pd.testing.assert_frame_equal(cache.read_csv(employees_csv, columns=['name', 'salary']),
+                                  expected[['name', 'salary']], check_dtype=False)
+    assert cache.cache_size() > 0
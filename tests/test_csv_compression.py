@@ -0,0 +1,35 @@
+import gzip
+
+import pandas as pd
+import pytest
+
+from csv_compression import detect_codec, is_bgzf, open_binary, open_text
+
+
+@pytest.mark.parametrize('suffix, codec', [('.csv.gz', 'gzip'), ('.csv.bz2', 'bz2'),
+                                           ('.csv.xz', 'xz')])
+def test_round_trip_matches_pandas(employees_csv, tmp_path, suffix, codec):
+    path = tmp_path / f'employees{suffix}'
+    text = employees_csv.read_text()
+    with open_text(path, 'w') as f:
+        f.write(text)
+    with open_text(path, 'a') as f:
+        f.write('Late Joiner,50,Chicago,1,Sales\n')
+
+    assert detect_codec(path) == codec
+    with open_text(path) as f:
+        assert f.read() == text + 'Late Joiner,50,Chicago,1,Sales\n'
+    with open_text(path) as f:
+        pd.testing.assert_frame_equal(pd.read_csv(f), pd.read_csv(path))
+
+
+def test_bgzf_is_readable_by_gzip(employees_csv, tmp_path):
+    path = tmp_path / 'employees.csv.gz'
+    with open_text(path, 'w') as f:
+        f.write(employees_csv.read_text() * 200)
+
+    assert is_bgzf(path)
+    with gzip.open(path, 'rb') as f:
+        expected = f.read()
+    with open_binary(path, workers=2) as f:
+        assert f.read() == expected
@@ -0,0 +1,30 @@
+import pandas as pd
+import pytest
+
+from csv_dialect import detect_dialect, read_csv_auto
+
+FRAME = pd.DataFrame({'name': ['Alice', 'Bob', 'Émile'], 'age': [25, 30, 35],
+                      'city': ['Paris; France', 'Oslo', 'Lyon']})
+
+
+@pytest.mark.parametrize('sep, lineterminator, encoding', [
+    (',', '\n', 'utf-8'),
+    (';', '\r\n', 'utf-8-sig'),
+    ('\t', '\n', 'cp1252'),
+    ('|', '\r', 'utf-8'),
+])
+def test_read_csv_auto_matches_explicit_options(tmp_path, sep, lineterminator, encoding):
+    path = tmp_path / 'data.csv'
+    FRAME.to_csv(path, sep=sep, lineterminator=lineterminator, encoding=encoding, index=False)
+
+    dialect = detect_dialect(path, use_cache=False)
+    assert dialect['delimiter'] == sep
+    assert dialect['has_header']
+    pd.testing.assert_frame_equal(read_csv_auto(path), FRAME)
+
+
+def test_detects_missing_header(tmp_path):
+    path = tmp_path / 'no_header.csv'
+    path.write_text("John,25,Engineer\nJane,30,Doctor\nJim,28,Teacher\n")
+    assert not detect_dialect(path)['has_header']
+    pd.testing.assert_frame_equal(read_csv_auto(path), pd.read_csv(path, header=None))
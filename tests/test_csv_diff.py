@@ -0,0 +1,33 @@
+import pandas as pd
+import pytest
+
+from csv_diff import diff_csv
+
+
+@pytest.mark.parametrize('max_keys', [1_000_000, 10])
+def test_changeset_matches_pandas_merge(employees_csv, tmp_path, max_keys):
+    old = pd.read_csv(employees_csv, dtype=str, keep_default_na=False)
+    new = old.drop(index=range(0, 500, 9)).copy()
+    new.loc[new.index[::17], 'salary'] = '1'
+    new = pd.concat([new, pd.DataFrame([['New Hire', '30', 'Denver', '70000', 'Sales']],
+                                       columns=old.columns)])
+    new_path = tmp_path / 'new.csv'
+    new.to_csv(new_path, index=False)
+
+    out_path = tmp_path / 'changes.csv'
+    counts = diff_csv(employees_csv, new_path, 'name', out_path, max_keys=max_keys, run_size=64,
+                      tmp_dir=tmp_path)
+
+    merged = old.merge(new, on='name', how='outer', suffixes=('_old', ''), indicator=True)
+    changed = (merged[[f"{c}_old" for c in old.columns if c != 'name']].to_numpy()
+               != merged[[c for c in old.columns if c != 'name']].to_numpy()).any(axis=1)
+    expected = {
+        'insert': set(merged.loc[merged['_merge'] == 'right_only', 'name']),
+        'delete': set(merged.loc[merged['_merge'] == 'left_only', 'name']),
+        'update': set(merged.loc[(merged['_merge'] == 'both') & changed, 'name']),
+    }
+
+    changes = pd.read_csv(out_path, dtype=str, keep_default_na=False)
+    for op, names in expected.items():
+        assert set(changes.loc[changes['op'] == op, 'name']) == names
+        assert counts[op] == len(names)
@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from csv_encoding import detect_encoding, open_utf8, transcode_file
+
+TEXT = "name,city,price\nJosé,München,12€\nZoë,Krakow,8€\n"
+
+
+@pytest.mark.parametrize('encoding', ['utf-8', 'utf-8-sig', 'utf-16', 'cp1252'])
+def test_matches_pandas_with_known_encoding(tmp_path, encoding):
+    path = tmp_path / 'data.csv'
+    path.write_bytes(TEXT.encode(encoding))
+
+    assert detect_encoding(path) in (encoding, 'utf-16-le' if encoding == 'utf-16' else encoding)
+    with open_utf8(path) as f:
+        pd.testing.assert_frame_equal(pd.read_csv(f), pd.read_csv(path, encoding=encoding))
+
+
+@pytest.mark.parametrize('encoding, tail', [
+    ('utf-8', 'Jim,Boston,9€\n'.encode('cp1252')),        # invalid UTF-8 -> cp1252
+    ('cp1252', b'Jim,Bo\x81ston,9\x80\n'),              # undefined in cp1252 -> latin-1
+])
+def test_fallback_after_sample(tmp_path, encoding, tail):
+    head = (TEXT * 5000).encode(encoding)
+    path = tmp_path / 'mixed.csv'
+    path.write_bytes(head + tail)
+    fallback = 'cp1252' if encoding == 'utf-8' else 'latin-1'
+
+    out_path = tmp_path / 'utf8.csv'
+    assert transcode_file(path, out_path) == encoding
+    assert out_path.read_bytes().decode('utf-8') == head.decode(encoding) + tail.decode(fallback)
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_export import export_csv, format_fixed
+
+
+@pytest.mark.parametrize('precision', [0, 2, 6, 18, 20])
+def test_format_fixed_matches_percent_f(precision):
+    values = np.concatenate([
+        np.random.default_rng(0).normal(0, 1e4, 1000),
+        [0.125, 2.675, -0.004, 1e300, -np.inf, np.inf, np.nan, -0.0, 2 ** 60],
+    ])
+    expected = ['' if np.isnan(value) else '%.*f' % (precision, value) for value in values]
+    with np.errstate(all='raise'):
+        assert format_fixed(values, precision).tolist() == expected
+
+
+@pytest.mark.parametrize('parts', [False, True])
+def test_export_matches_to_csv(tmp_path, parts):
+    frame = pd.DataFrame({
+        'name': [f"Product {i}" for i in range(1000)],
+        'price': np.random.default_rng(1).random(1000) * 100,
+        'stock': np.arange(1000),
+    })
+    target = tmp_path / ('parts' if parts else 'out.csv')
+    paths = export_csv(frame, target, block_rows=128, workers=2, parts=parts, use_threads=True)
+
+    expected = frame.to_csv(index=False)
+    if parts:
+        text = ''.join(Path(p).read_text().split('\n', 1)[1] for p in sorted(paths))
+        assert text == expected.split('\n', 1)[1]
+    else:
+        assert target.read_text() == expected
@@ -0,0 +1,55 @@
+import csv
+import os
+
+from csv_follow import CSVFollower
+
+HEADER = ['product', 'price', 'note']
+
+
+def _append(path, rows):
+    with open(path, 'a', newline='') as f:
+        csv.writer(f).writerows(rows)
+
+
+def test_records_match_csv_reader(tmp_path):
+    path = tmp_path / 'products.csv'
+    _append(path, [HEADER, ['Keyboard', '75', 'plain']])
+    follower = CSVFollower(path)
+    try:
+        seen = follower.poll()
+
+        # A record cut in the middle of a quoted newline is held back
+        with open(path, 'a', newline='') as f:
+            f.write('Mouse,25,"two\nlines')
+        seen += follower.poll()
+        with open(path, 'a', newline='') as f:
+            f.write('"\n')
+        _append(path, [['Monitor', '300', 'says "wow"']])
+        seen += follower.poll()
+        follower.save_checkpoint()
+    finally:
+        follower.close()
+
+    with open(path, newline='') as f:
+        assert [HEADER] + seen == list(csv.reader(f))
+
+
+def test_resumes_from_checkpoint_and_follows_rotation(tmp_path):
+    path = tmp_path / 'products.csv'
+    _append(path, [HEADER, ['Keyboard', '75', '']])
+    follower = CSVFollower(path)
+    assert follower.poll() == [['Keyboard', '75', '']]
+    follower.save_checkpoint()
+    follower.close()
+
+    _append(path, [['Mouse', '25', '']])
+    follower = CSVFollower(path)
+    try:
+        assert follower.poll() == [['Mouse', '25', '']]
+
+        os.rename(path, tmp_path / 'products.csv.1')
+        _append(path, [HEADER, ['Monitor', '300', '']])
+        assert follower.poll() == [['Monitor', '300', '']]
+        assert follower.rotations == 1
+    finally:
+        follower.close()
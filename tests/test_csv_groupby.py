@@ -0,0 +1,18 @@
+import pandas as pd
+
+from csv_groupby import streaming_groupby
+
+
+def test_matches_pandas_groupby(employees_csv):
+    expected = (pd.read_csv(employees_csv).groupby('department')['salary']
+                .agg(['count', 'sum', 'min', 'max', 'mean', 'var', 'median']))
+
+    result = streaming_groupby(employees_csv, 'department', 'salary', workers=2, parts=3,
+                               chunksize=50).sort_index()
+
+    pd.testing.assert_frame_equal(result[['count', 'sum', 'min', 'max', 'mean', 'var']],
+                                  expected[['count', 'sum', 'min', 'max', 'mean', 'var']],
+                                  check_dtype=False, check_names=False)
+    # The median comes from a sketch with 1% relative accuracy
+    relative_error = (result['median_approx'] - expected['median']).abs() / expected['median']
+    assert (relative_error <= 0.01).all()
@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from csv_impute import impute_csv
+
+
+@pytest.fixture
+def missing_csv(tmp_path):
+    path = tmp_path / 'missing.csv'
+    with open(path, 'w') as f:
+        f.write('name,age,city,score\n')
+        for i in range(300):
+            age = '' if i % 11 == 0 else 20 + i % 37
+            city = '' if i % 13 == 0 else ['Austin', 'Boston', 'Boston', 'Denver'][i % 4]
+            score = '' if i % 5 == 0 else i * 1.5
+            f.write(f"Person {i},{age},{city},{score}\n")
+    return path
+
+
+def test_matches_pandas_fillna(missing_csv, tmp_path):
+    out_path = tmp_path / 'filled.csv'
+    fills = impute_csv(missing_csv, out_path, strategies={'age': 'mean', 'city': 'mode',
+                                                          'score': 'ffill'},
+                       constants={'name': 'Unknown'}, chunksize=40)
+
+    frame = pd.read_csv(missing_csv)
+    assert fills['age'] == pytest.approx(frame['age'].mean())
+    assert fills['city'] == frame['city'].mode()[0]
+
+    result = pd.read_csv(out_path)
+    assert result['age'].tolist() == pytest.approx(frame['age'].fillna(fills['age']).tolist(),
+                                                   abs=0.5)
+    assert result['city'].tolist() == frame['city'].fillna(fills['city']).tolist()
+    pd.testing.assert_series_equal(result['score'], frame['score'].ffill())
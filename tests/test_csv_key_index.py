@@ -0,0 +1,35 @@
+import csv
+
+from csv_key_index import KeyIndex, _encode_float
+
+
+def _rows(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_lookup_and_range_scan_match_filtering(employees_csv):
+    rows = _rows(employees_csv)
+
+    by_department = KeyIndex(employees_csv, 'department')
+    try:
+        expected = [row for row in rows if row[4] == 'Sales']
+        assert sorted(by_department.lookup('Sales')) == sorted(expected)
+    finally:
+        by_department.close()
+
+    by_salary = KeyIndex(employees_csv, 'salary', key_type='int')
+    try:
+        expected = sorted((row for row in rows if row[3] and 70000 <= int(row[3]) <= 80000),
+                          key=lambda row: int(row[3]))
+        result = list(by_salary.range_scan(70000, 80000))
+        assert [int(row[3]) for row in result] == [int(row[3]) for row in expected]
+        assert sorted(result) == sorted(expected)
+    finally:
+        by_salary.close()
+
+
+def test_float_keys_sort_like_floats():
+    values = [-1e300, -2.5, -0.0, 0.0, 1e-300, 3.0, float('inf')]
+    assert sorted(values, key=_encode_float) == sorted(values)
+    assert _encode_float(-0.0) == _encode_float(0.0)
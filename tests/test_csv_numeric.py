@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from csv_numeric import parse_numeric_csv
+
+
+@pytest.fixture
+def numbers_csv(tmp_path):
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame({
+        'age': rng.integers(20, 65, 5000),
+        'bonus': rng.normal(5000, 1500, 5000).round(2),
+        'score': rng.random(5000),
+    })
+    frame.loc[::97, 'bonus'] = np.nan
+    path = tmp_path / 'numbers.csv'
+    frame.to_csv(path, index=False)
+    return path
+
+
+@pytest.mark.parametrize('usecols', [None, ['score', 'age']])
+def test_matches_pandas(numbers_csv, usecols):
+    # round_trip: the C parser's default float conversion can be 1 ulp off
+    expected = pd.read_csv(numbers_csv, usecols=usecols, float_precision='round_trip')
+    columns, errors = parse_numeric_csv(numbers_csv, usecols=usecols, block_bytes=4096)
+
+    assert errors == []
+    assert list(columns) == (usecols or list(expected.columns))
+    for name, values in columns.items():
+        assert values.flags['C_CONTIGUOUS']
+        np.testing.assert_array_equal(values, expected[name].to_numpy(dtype=np.float64))
+
+
+def test_bad_fields_and_blank_lines(tmp_path):
+    path = tmp_path / 'messy.csv'
+    path.write_text('a,b\n1,2\n\n3,oops\r\n1e3, 7 \n5,6')
+    columns, errors = parse_numeric_csv(path)
+    expected = pd.read_csv(path, dtype={'b': str})
+
+    np.testing.assert_array_equal(columns['a'], expected['a'].to_numpy(dtype=np.float64))
+    np.testing.assert_array_equal(columns['b'], [2.0, np.nan, 7.0, 6.0])
+    assert errors == [(1, 'b', 'oops')]
@@ -0,0 +1,37 @@
+import pandas as pd
+import pytest
+
+from csv_parallel import read_csv_parallel
+
+
+@pytest.fixture
+def employees(tmp_path):
+    path = tmp_path / 'employees.csv'
+    with open(path, 'w', newline='') as f:
+        f.write('name,age,city,salary\n')
+        for i in range(2000):
+            city = '"Boston,\nMA"' if i % 97 == 0 else 'Chicago'
+            f.write(f"Employee {i},{20 + i % 40},{city},{60000 + i}\n")
+    return path
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'usecols': ['age', 'salary']},
+    {'usecols': ['salary', 'name']},
+    {'usecols': [0, 3]},
+    {'index_col': 0},
+    {'index_col': 'name', 'usecols': ['name', 'salary']},
+    {'index_col': False},
+    {'dtype': {'age': 'float64'}},
+])
+def test_matches_pandas(employees, kwargs):
+    expected = pd.read_csv(employees, **kwargs)
+    result = read_csv_parallel(employees, workers=2, parts=5, **kwargs)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+@pytest.mark.parametrize('option', ['header', 'names', 'skiprows', 'nrows'])
+def test_rejects_line_options(employees, option):
+    with pytest.raises(ValueError):
+        read_csv_parallel(employees, workers=1, **{option: 1})
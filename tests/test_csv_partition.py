@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from csv_partition import PartitionedWriter, read_partitioned
+
+
+@pytest.fixture
+def partitioned(employees_csv, tmp_path):
+    root = tmp_path / 'partitioned'
+    with PartitionedWriter(root, ['department'], max_open_files=2) as writer:
+        for chunk in pd.read_csv(employees_csv, chunksize=100):
+            writer.write_frame(chunk)
+    return root
+
+
+@pytest.mark.parametrize('filters', [
+    [('department', '==', 'Engineering')],
+    [('department', 'not in', ['Sales', 'Marketing']), ('age', '<', 30)],
+    [('department', '!=', 'Sales')],
+])
+def test_matches_pandas_filter(employees_csv, partitioned, filters):
+    frame = pd.read_csv(employees_csv)
+    mask = pd.Series(True, index=frame.index)
+    for column, op, value in filters:
+        if op == '==':
+            mask &= frame[column] == value
+        elif op == '!=':
+            mask &= frame[column] != value
+        elif op == 'not in':
+            mask &= ~frame[column].isin(value)
+        else:
+            mask &= frame[column] < value
+    columns = ['name', 'salary', 'department']
+    expected = frame[mask][columns].sort_values('name').reset_index(drop=True)
+
+    result = read_partitioned(partitioned, filters=filters, columns=columns)
+    pd.testing.assert_frame_equal(result.sort_values('name').reset_index(drop=True), expected)
+
+
+def test_typed_partition_values(tmp_path):
+    frame = pd.DataFrame({'year': [2023.0, 2024.0, 2024.0], 'active': [True, False, True],
+                          'value': [1, 2, 3]})
+    with PartitionedWriter(tmp_path, ['year', 'active']) as writer:
+        writer.write_frame(frame)
+
+    assert sorted(read_partitioned(tmp_path, [('year', '==', 2024)])['value']) == [2, 3]
+    assert read_partitioned(tmp_path, [('active', '==', False)])['value'].tolist() == [2]
+    assert sorted(read_partitioned(tmp_path, [('year', '!=', 'x')])['value']) == [1, 2, 3]
@@ -0,0 +1,22 @@
+import pandas as pd
+import pytest
+
+import csv_peek
+from csv_peek import count_records, peek
+
+
+@pytest.mark.parametrize('block_bytes', [7, 64, 1 << 20])
+def test_count_matches_pandas(employees_csv, monkeypatch, block_bytes):
+    # Blank and whitespace-only lines outside quotes are skipped by pandas too
+    with open(employees_csv, 'a', newline='') as f:
+        f.write('\n  \r\n"Quoted\n\nname",30,Chicago,1,Sales\n\nLast,1,Chicago,2,Sales')
+    monkeypatch.setattr(csv_peek, 'COUNT_BLOCK_BYTES', block_bytes)
+    assert count_records(employees_csv, workers=1) == len(pd.read_csv(employees_csv))
+
+
+def test_peek_describes_file(employees_csv):
+    info = peek(employees_csv, count=True, workers=1)
+    expected = pd.read_csv(employees_csv)
+    assert info['columns'] == list(expected.columns)
+    assert info['delimiter'] == ','
+    assert info['rows'] == len(expected)
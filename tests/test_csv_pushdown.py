@@ -0,0 +1,33 @@
+import operator
+
+import pandas as pd
+import pytest
+
+from csv_pushdown import read_csv_pushdown
+
+OPERATORS = {'<': operator.lt, '>=': operator.ge, '==': operator.eq, '!=': operator.ne,
+             'in': lambda column, values: column.isin(values)}
+
+
+@pytest.mark.parametrize('columns, filters', [
+    (None, [('age', '<', 35)]),
+    (['name', 'salary'], [('age', '>=', 30), ('department', '==', 'Engineering')]),
+    (['salary'], [('department', 'in', ['Sales', 'Marketing']), ('salary', '!=', 60000)]),
+])
+def test_matches_pandas(employees_csv, columns, filters):
+    frame = pd.read_csv(employees_csv)
+    mask = pd.Series(True, index=frame.index)
+    for column, op, value in filters:
+        mask &= OPERATORS[op](frame[column], value)
+    expected = frame[mask].reset_index(drop=True)
+    if columns is not None:
+        expected = expected[columns]
+
+    result = read_csv_pushdown(employees_csv, columns=columns, filters=filters, chunksize=64)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_no_matching_rows_keeps_columns(employees_csv):
+    result = read_csv_pushdown(employees_csv, columns=['name', 'age'], filters=[('age', '>', 1000)])
+    assert list(result.columns) == ['name', 'age']
+    assert len(result) == 0
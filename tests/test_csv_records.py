@@ -0,0 +1,28 @@
+import pandas as pd
+
+from csv_records import RecordReader, iter_column_batches
+
+
+def test_records_match_pandas(employees_csv):
+    expected = pd.read_csv(employees_csv)
+
+    with RecordReader(employees_csv) as reader:
+        result = pd.DataFrame(list(reader), columns=reader.fieldnames)
+
+    assert result['name'].tolist() == expected['name'].tolist()
+    assert result['city'].tolist() == expected['city'].tolist()
+    assert result['age'].tolist() == expected['age'].tolist()
+    # Missing salaries come back as None (records) / NaN (pandas)
+    pd.testing.assert_series_equal(result['salary'].astype('float64'), expected['salary'])
+
+
+def test_column_batches_match_pandas(employees_csv):
+    expected = pd.read_csv(employees_csv)
+    batches = list(iter_column_batches(employees_csv, batch_size=128))
+
+    for column in ['age', 'salary']:
+        values = [value for batch in batches for value in batch[column]]
+        pd.testing.assert_series_equal(pd.Series(values, dtype='float64', name=column),
+                                       expected[column].astype('float64'))
+    cities = [value for batch in batches for value in batch['city']]
+    assert cities == expected['city'].tolist()
@@ -0,0 +1,44 @@
+import csv
+
+import pytest
+
+from csv_row_index import RowIndex
+
+
+def test_rows_match_csv_reader(employees_csv):
+    with open(employees_csv, newline='') as f:
+        header, *expected = list(csv.reader(f))
+
+    index = RowIndex(employees_csv)
+    try:
+        assert index.header == header
+        assert len(index) == len(expected)
+        assert index.row(53) == expected[53]        # quoted newline
+        assert index.row(-1) == expected[-1]
+        assert index.rows(100, 130) == expected[100:130]
+    finally:
+        index.close()
+
+
+def test_refresh_after_append(employees_csv):
+    index = RowIndex(employees_csv)
+    try:
+        with open(employees_csv, 'a', newline='') as f:
+            csv.writer(f).writerow(['New Hire', 30, 'Denver', 70000, 'Sales'])
+        index.refresh()
+        assert index.row(-1) == ['New Hire', '30', 'Denver', '70000', 'Sales']
+    finally:
+        index.close()
+
+
+def test_record_offset_bounds(employees_csv):
+    index = RowIndex(employees_csv)
+    try:
+        with open(employees_csv, 'rb') as f:
+            f.seek(index.record_offset(1))
+            assert f.readline().startswith(b'Employee 1,')
+        for n in (len(index), -len(index) - 1):
+            with pytest.raises(IndexError):
+                index.record_offset(n)
+    finally:
+        index.close()
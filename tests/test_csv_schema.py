@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from csv_schema import read_csv_typed
+
+
+def test_values_match_pandas(employees_csv):
+    expected = pd.read_csv(employees_csv)
+    result = read_csv_typed(employees_csv, sample_rows=50)
+
+    assert isinstance(result['department'].dtype, pd.CategoricalDtype)
+    assert result.memory_usage(deep=True).sum() < expected.memory_usage(deep=True).sum()
+    for column in expected.columns:
+        if pd.api.types.is_numeric_dtype(expected[column]):
+            np.testing.assert_array_equal(result[column].to_numpy(dtype=np.float64),
+                                          expected[column].to_numpy(dtype=np.float64))
+        else:
+            assert result[column].astype(str).tolist() == expected[column].tolist()
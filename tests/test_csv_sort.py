@@ -0,0 +1,30 @@
+import random
+
+import pandas as pd
+
+from csv_sort import external_sort, sorted_stream, top_k
+
+
+def test_sorted_stream_matches_sorted(tmp_path):
+    items = [random.Random(0).randint(0, 100) for _ in range(1000)]
+    items = [(value, position) for position, value in enumerate(items)]
+    result = list(sorted_stream(items, key=lambda item: item[0], run_size=64, tmp_dir=tmp_path))
+    assert result == sorted(items, key=lambda item: item[0])
+    assert not list(tmp_path.iterdir())     # spilled runs are removed
+
+
+def test_external_sort_matches_pandas(employees_csv, tmp_path):
+    out_path = tmp_path / 'sorted.csv'
+    written = external_sort(employees_csv, out_path, 'age', key_type=int, run_size=64,
+                            tmp_dir=tmp_path)
+
+    expected = pd.read_csv(employees_csv).sort_values('age', kind='stable')
+    result = pd.read_csv(out_path)
+    assert written == len(expected)
+    pd.testing.assert_frame_equal(result, expected.reset_index(drop=True))
+
+
+def test_top_k_matches_nlargest(employees_csv):
+    header, rows = top_k(employees_csv, 'salary', 10)
+    expected = pd.read_csv(employees_csv).nlargest(10, 'salary')
+    assert [float(row[header.index('salary')]) for row in rows] == expected['salary'].tolist()
@@ -0,0 +1,43 @@
+import csv
+
+import pandas as pd
+import pytest
+
+from csv_writer import BufferedCSVWriter
+
+HEADER = ['name', 'note', 'score']
+ROWS = [['Alice', 'says "hi", twice', 95], ['Bob', 'line\nbreak', 87]]
+
+
+@pytest.mark.parametrize('fmtparams', [{}, {'delimiter': ';', 'quoting': csv.QUOTE_ALL}])
+def test_output_matches_csv_writer(tmp_path, fmtparams):
+    expected_path = tmp_path / 'expected.csv'
+    with open(expected_path, 'w', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n', **fmtparams)
+        writer.writerow(HEADER)
+        writer.writerows(ROWS + ROWS)
+
+    path = tmp_path / 'out.csv'
+    with BufferedCSVWriter(path, fieldnames=HEADER, buffer_rows=1, **fmtparams) as writer:
+        writer.write_rows(ROWS)
+        writer.write_frame(pd.DataFrame(ROWS, columns=HEADER))
+
+    assert path.read_bytes() == expected_path.read_bytes()
+
+
+@pytest.mark.parametrize('suffix', ['.csv', '.csv.gz'])
+def test_aborted_append_leaves_file_unchanged(tmp_path, suffix):
+    path = tmp_path / f'out{suffix}'
+    with BufferedCSVWriter(path, fieldnames=HEADER) as writer:
+        writer.write_rows(ROWS)
+    before = path.read_bytes()
+
+    with pytest.raises(RuntimeError):
+        with BufferedCSVWriter(path, mode='a', buffer_rows=1) as writer:
+            writer.write_rows(ROWS * 100)
+            raise RuntimeError('stop')
+    assert path.read_bytes() == before
+
+    with BufferedCSVWriter(path, mode='a') as writer:
+        writer.write_rows(ROWS)
+    pd.testing.assert_frame_equal(pd.read_csv(path), pd.DataFrame(ROWS + ROWS, columns=HEADER))